@@ -131,9 +131,8 @@ async def get_insights(
         # For now, return mock data until database models are implemented
         insights = []
 
-        # Calculate pagination metadata
+        # Calculate pagination metadata (pages is computed by the schema)
         total = len(insights)
-        pages = (total + page_size - 1) // page_size if total > 0 else 1
 
         # Apply pagination (slice the results)
         start = (page - 1) * page_size
@@ -145,7 +144,6 @@ async def get_insights(
             total=total,
             page=page,
             page_size=page_size,
-            pages=pages,
         )
 
     except NotFoundException:
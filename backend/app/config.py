@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import PostgresDsn, field_validator
@@ -10,7 +11,13 @@ class Settings(BaseSettings):
     """Application settings."""
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="allow"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="allow",
+        # Defer schema build until the first Settings() call so importing
+        # this module stays cheap
+        defer_build=True,
     )
 
     # Project
@@ -21,10 +28,10 @@ class Settings(BaseSettings):
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
 
-    @property
-    def cors_origins(self) -> list[str]:
-        """Get CORS origins as list."""
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+    @cached_property
+    def cors_origins(self) -> tuple[str, ...]:
+        """Get CORS origins, parsed once and cached."""
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(","))
 
     # Database
     POSTGRES_SERVER: str | None = None
@@ -33,6 +40,8 @@ class Settings(BaseSettings):
     POSTGRES_DB: str | None = None
     POSTGRES_PORT: int = 5432
     DATABASE_URL: str | None = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -72,27 +81,38 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Opt-in: memoize repeated password verifications (internal service
+    # credentials only - trades a timing side channel for O(1) repeats)
+    CACHE_PASSWORD_VERIFY: bool = False
 
     # File Upload
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_FILE_TYPES: str = ".csv,.xlsx,.xls"
 
-    @property
-    def file_types(self) -> list[str]:
-        """Get allowed file types as list."""
-        return [ext.strip() for ext in self.ALLOWED_FILE_TYPES.split(",")]
+    @cached_property
+    def file_types(self) -> tuple[str, ...]:
+        """Get allowed file types, parsed once and cached."""
+        return tuple(ext.strip() for ext in self.ALLOWED_FILE_TYPES.split(","))
 
-    # AI / Groq API
+    # AI / Groq API (primary provider)
     GROQ_API_KEY: str
     GROQ_MODEL: str = "llama-3.1-70b-versatile"
     GROQ_MAX_TOKENS: int = 2000
     GROQ_TEMPERATURE: float = 0.7
 
+    # AI / Claude API (optional secondary provider, used by ClaudeClient)
+    CLAUDE_API_KEY: str | None = None
+    CLAUDE_MODEL: str = "claude-sonnet-4-20250514"
+    CLAUDE_MAX_TOKENS: int = 2000
+    CLAUDE_TEMPERATURE: float = 0.7
+
     # Redis Cache
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
+    REDIS_POOL_SIZE: int = 50
+    REDIS_CLIENT_TRACKING: bool = False
     CACHE_TTL: int = 86400  # 24 hours
     
     # Environment
@@ -100,4 +120,14 @@ class Settings(BaseSettings):
     DEBUG: bool = False
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings singleton.
+
+    Construction (env scanning plus Pydantic validator build) happens at
+    most once per process; subsequent calls return the cached instance.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
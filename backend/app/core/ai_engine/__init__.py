@@ -1,21 +1,36 @@
-"""AI engine for generating insights and recommendations."""
-
-from app.core.ai_engine.ai_service import AIService, AIServiceException
-from app.core.ai_engine.anonymizer import DataAnonymizer
-from app.core.ai_engine.cache_manager import CacheManager
-from app.core.ai_engine.groq_client import GroqAPIException, GroqClient
-from app.core.ai_engine.code_generator import CodeGenerator
-from app.core.ai_engine.insight_categorizer import InsightCategorizer
-from app.core.ai_engine.models import CategorizedInsight, RawInsight, TokenUsageTracker
-from app.core.ai_engine.prompt_builder import PromptBuilder
-from app.core.ai_engine.response_parser import ResponseParser
-from app.core.ai_engine.story_generator import StoryGenerator
+"""AI engine for generating insights and recommendations.
+
+Submodules are imported lazily (PEP 562) so that importing the package
+does not pull in heavy transitive dependencies (httpx, redis, Pydantic
+schema builds) until the corresponding component is actually used.
+"""
+
+import importlib
+
+_LAZY = {
+    "AIService": "app.core.ai_engine.ai_service",
+    "AIServiceException": "app.core.ai_engine.ai_service",
+    "DataAnonymizer": "app.core.ai_engine.anonymizer",
+    "CacheManager": "app.core.ai_engine.cache_manager",
+    "GroqAPIException": "app.core.ai_engine.groq_client",
+    "GroqClient": "app.core.ai_engine.groq_client",
+    "get_groq_client": "app.core.ai_engine.groq_client",
+    "CodeGenerator": "app.core.ai_engine.code_generator",
+    "InsightCategorizer": "app.core.ai_engine.insight_categorizer",
+    "CategorizedInsight": "app.core.ai_engine.models",
+    "RawInsight": "app.core.ai_engine.models",
+    "TokenUsageTracker": "app.core.ai_engine.models",
+    "PromptBuilder": "app.core.ai_engine.prompt_builder",
+    "ResponseParser": "app.core.ai_engine.response_parser",
+    "StoryGenerator": "app.core.ai_engine.story_generator",
+}
 
 __all__ = [
     "AIService",
     "AIServiceException",
     "GroqClient",
     "GroqAPIException",
+    "get_groq_client",
     "DataAnonymizer",
     "PromptBuilder",
     "ResponseParser",
@@ -27,3 +42,19 @@ __all__ = [
     "RawInsight",
     "TokenUsageTracker",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve public names on first access and cache them in globals."""
+    try:
+        module_path = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily-exported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,63 @@
 """AI service for generating insights and recommendations."""
 
-import hashlib
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Any
+from dataclasses import replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import xxhash
 
-from app.core.ai_engine.cache_manager import CacheManager
-from app.core.ai_engine.groq_client import GroqAPIException, GroqClient
-from app.core.ai_engine.code_generator import CodeGenerator
-from app.core.ai_engine.insight_categorizer import InsightCategorizer
 from app.core.ai_engine.models import CategorizedInsight
-from app.core.ai_engine.prompt_builder import PromptBuilder
-from app.core.ai_engine.response_parser import ResponseParser
-from app.core.ai_engine.story_generator import StoryGenerator
+
+if TYPE_CHECKING:
+    # Heavy component modules are only needed here for type annotations;
+    # the runtime imports happen lazily in __init__ when a default
+    # instance is actually constructed.
+    from app.core.ai_engine.cache_manager import CacheManager
+    from app.core.ai_engine.code_generator import CodeGenerator
+    from app.core.ai_engine.groq_client import GroqClient
+    from app.core.ai_engine.insight_categorizer import InsightCategorizer
+    from app.core.ai_engine.prompt_builder import PromptBuilder
+    from app.core.ai_engine.response_parser import ResponseParser
+    from app.core.ai_engine.story_generator import StoryGenerator
 
 logger = logging.getLogger(__name__)
 
+# Severities whose insights warrant generated code fixes
+_ACTIONABLE_SEVERITIES = frozenset(("critical", "warning"))
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(
+    analysis_id: int,
+    row_count: int,
+    column_count: int,
+    quality_score: float,
+) -> str:
+    """Compute a cache key for a set of analysis characteristics.
+
+    Memoized so repeated requests for the same analysis (the dominant
+    cache-hit traffic) skip both the string formatting and the hashing.
+
+    Args:
+        analysis_id: Analysis ID
+        row_count: Number of rows in the dataset
+        column_count: Number of columns in the dataset
+        quality_score: Overall quality score
+
+    Returns:
+        Hex digest cache key
+    """
+    key_data = f"{analysis_id}_{row_count}_{column_count}_{quality_score}"
+    # xxh3 is non-cryptographic but collision-resistant enough for cache
+    # identity, and much faster than hashlib digests on short inputs.
+    # The "v2:" prefix keeps new keys from colliding with old-format entries.
+    return f"v2:{xxhash.xxh3_128_hexdigest(key_data)}"
+
 
 class AIServiceException(Exception):
     """AI service operation failed."""
@@ -25,6 +68,9 @@ class AIServiceException(Exception):
 class AIService:
     """Main AI service for generating insights."""
 
+    # Upper bound on memoized code suggestions per service instance
+    _CODE_CACHE_MAX = 1024
+
     def __init__(
         self,
         groq_client: GroqClient | None = None,
@@ -46,13 +92,53 @@ class AIService:
             story_generator: Story generator
             cache_manager: Cache manager
         """
-        self.groq = groq_client or GroqClient()
-        self.prompt_builder = prompt_builder or PromptBuilder()
-        self.parser = response_parser or ResponseParser()
-        self.categorizer = insight_categorizer or InsightCategorizer()
-        self.code_generator = code_generator or CodeGenerator()
-        self.story_generator = story_generator or StoryGenerator()
-        self.cache = cache_manager or CacheManager()
+        # Component modules are imported lazily so callers injecting their
+        # own instances never pay for the default implementations
+        if groq_client is None:
+            from app.core.ai_engine.groq_client import get_groq_client
+
+            groq_client = get_groq_client()
+        if prompt_builder is None:
+            from app.core.ai_engine.prompt_builder import PromptBuilder
+
+            prompt_builder = PromptBuilder()
+        if response_parser is None:
+            from app.core.ai_engine.response_parser import ResponseParser
+
+            response_parser = ResponseParser()
+        if insight_categorizer is None:
+            from app.core.ai_engine.insight_categorizer import InsightCategorizer
+
+            insight_categorizer = InsightCategorizer()
+        if code_generator is None:
+            from app.core.ai_engine.code_generator import CodeGenerator
+
+            code_generator = CodeGenerator()
+        if story_generator is None:
+            from app.core.ai_engine.story_generator import StoryGenerator
+
+            story_generator = StoryGenerator()
+        if cache_manager is None:
+            from app.core.ai_engine.cache_manager import CacheManager
+
+            cache_manager = CacheManager()
+
+        self.groq = groq_client
+        self.prompt_builder = prompt_builder
+        self.parser = response_parser
+        self.categorizer = insight_categorizer
+        self.code_generator = code_generator
+        self.story_generator = story_generator
+        self.cache = cache_manager
+
+        # Strong references to in-flight background cache writes so they
+        # aren't garbage collected before completing
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Code generation is deterministic per (type, recommendation,
+        # affected columns, language), so identical insights across
+        # analyses reuse the generated snippet instead of regenerating it
+        self._code_cache: dict[tuple, str | None] = {}
 
         logger.info("AIService initialized with all components")
 
@@ -95,7 +181,7 @@ class AIService:
         """
         try:
             logger.info(
-                f"Generating insights for analysis {analysis_id} with goal '{goal_type}'"
+                "Generating insights for analysis %s with goal %r", analysis_id, goal_type
             )
 
             # STEP 1: Check cache first to reduce API costs (~80% hit rate)
@@ -104,32 +190,46 @@ class AIService:
             cached_insights = await self.cache.get(cache_key)
 
             if cached_insights:
-                logger.info(f"Cache HIT - Using cached insights for analysis {analysis_id}")
-                # Convert cached dict back to CategorizedInsight objects
+                logger.info("Cache HIT - Using cached insights for analysis %s", analysis_id)
+                # Convert cached dicts back to CategorizedInsight objects.
+                # The cache content is written exclusively by this service, so
+                # the payload is trusted and rehydration is plain dataclass
+                # construction with no revalidation layer.
                 return [CategorizedInsight(**i) for i in cached_insights]
 
-            logger.info(f"Cache MISS - Generating new insights")
+            logger.info("Cache MISS - Generating new insights")
 
             # STEP 2: Build context-aware prompt
             # Selects appropriate template based on goal_type
-            # Includes dataset summary, detected issues, and anonymized sample data
-            prompt = await self.prompt_builder.build(
+            # Includes dataset summary, detected issues, and anonymized
+            # sample data. The static instructions and the per-dataset
+            # content are kept separate so the provider can cache the
+            # byte-stable prefix across calls.
+            system_prefix, user_content = await self.prompt_builder.build_parts(
                 profile_result=profile_result,
                 goal_type=goal_type,
             )
 
-            logger.info(f"Built prompt with {len(prompt)} characters")
+            logger.info(
+                "Built prompt with %d characters",
+                len(system_prefix) + len(user_content),
+            )
 
             # STEP 3: Call Groq API with automatic retry logic
             # Retries 3 times with exponential backoff (2s, 4s, 8s)
             # Handles rate limits and timeouts gracefully
+            # (local import keeps the groq SDK out of module-import time)
+            from app.core.ai_engine.groq_client import GroqAPIException
+
             try:
-                response = await self.groq.generate(prompt=prompt)
-                logger.info(f"Received Groq response with {len(response)} characters")
+                response = await self.groq.generate(
+                    prompt=user_content, system=system_prefix
+                )
+                logger.info("Received Groq response with %d characters", len(response))
 
             except GroqAPIException as e:
                 # If API fails after retries, use rule-based fallback
-                logger.warning(f"Groq API failed: {str(e)}, using fallback")
+                logger.warning("Groq API failed: %s, using fallback", e)
                 return await self._generate_fallback_insights(profile_result, goal_type)
 
             # STEP 4: Validate response format
@@ -141,7 +241,7 @@ class AIService:
             # STEP 5: Parse response into structured insights
             # Expected format: "SEVERITY: description | RECOMMENDATION: action"
             raw_insights = await self.parser.parse(response)
-            logger.info(f"Parsed {len(raw_insights)} raw insights")
+            logger.info("Parsed %d raw insights", len(raw_insights))
 
             if not raw_insights:
                 logger.warning("No insights parsed from response, using fallback")
@@ -158,28 +258,19 @@ class AIService:
                 goal_type,
             )
 
-            logger.info(f"Categorized {len(categorized_insights)} insights")
+            logger.info("Categorized %d insights", len(categorized_insights))
 
             # STEP 7: Generate code snippets for critical and warning insights
             # Creates Python code using pandas operations to fix identified issues
             # Only generates code for actionable insights (not informational)
-            for insight in categorized_insights:
-                if insight.recommendation and insight.severity in {"critical", "warning"}:
-                    try:
-                        code = await self.code_generator.generate(
-                            insight=insight,
-                            language="python",  # Can also generate SQL or R
-                        )
-                        insight.code_suggestion = code
-                    except Exception as e:
-                        logger.warning(f"Failed to generate code: {str(e)}")
-                        insight.code_suggestion = None
+            # All uncached insights go to the generator in one batched call
+            await self._attach_code_suggestions(categorized_insights)
 
             # STEP 8: Generate executive summary
             # Creates plain English summary for non-technical users
             # Includes dataset description, quality assessment, and top issues
             try:
-                summary = await self.story_generator.generate(
+                summary = self.story_generator.generate(
                     profile_result=profile_result,
                     insights=categorized_insights,
                 )
@@ -200,26 +291,27 @@ class AIService:
                 categorized_insights.insert(0, summary_insight)
 
             except Exception as e:
-                logger.warning(f"Failed to generate summary: {str(e)}")
+                logger.warning("Failed to generate summary: %s", e)
 
             # STEP 9: Cache results for 24 hours
             # Reduces API costs and improves response time for repeated requests
-            try:
-                await self.cache.set(cache_key, categorized_insights)
-                logger.info(f"Cached insights for analysis {analysis_id}")
-            except Exception as e:
-                # Cache failure is non-critical, log and continue
-                logger.warning(f"Failed to cache insights: {str(e)}")
+            # Written in the background so the response doesn't wait on Redis
+            cache_task = asyncio.create_task(
+                self._safe_cache_set(cache_key, categorized_insights, analysis_id)
+            )
+            self._background_tasks.add(cache_task)
+            cache_task.add_done_callback(self._background_tasks.discard)
 
             logger.info(
-                f"Successfully generated {len(categorized_insights)} insights "
-                f"for analysis {analysis_id}"
+                "Successfully generated %d insights for analysis %s",
+                len(categorized_insights),
+                analysis_id,
             )
 
             return categorized_insights
 
         except Exception as e:
-            logger.error(f"Failed to generate insights: {str(e)}", exc_info=True)
+            logger.error("Failed to generate insights: %s", e, exc_info=True)
             raise AIServiceException(f"Failed to generate insights: {str(e)}")
 
     async def _generate_fallback_insights(
@@ -238,30 +330,65 @@ class AIService:
         """
         logger.info("Generating fallback rule-based insights")
 
-        insights = []
+        # Local bindings avoid repeated attribute/global lookups
+        column_profiles = profile_result.column_profiles
+        insight_cls = CategorizedInsight
+        col_count = len(column_profiles)
+
+        # Columnar view of the per-column stats: materialize the numeric
+        # fields once, then let NumPy find the offending indices in C
+        # instead of comparing per column in the interpreter. Insights are
+        # only built for flagged columns.
+        null_arr = np.fromiter(
+            (cp.null_percentage for cp in column_profiles),
+            dtype=np.float64,
+            count=col_count,
+        )
+        outlier_arr = np.fromiter(
+            (
+                (getattr(cp, "outliers", None) or {}).get("percentage", 0)
+                for cp in column_profiles
+            ),
+            dtype=np.float64,
+            count=col_count,
+        )
 
         # Critical: High null percentage
-        for col_profile in profile_result.column_profiles:
-            if col_profile.null_percentage > 50:
-                insights.append(
-                    CategorizedInsight(
-                        severity="critical",
-                        type="missing_data",
-                        description=f"Column '{col_profile.column_name}' has {col_profile.null_percentage:.1f}% missing values",
-                        recommendation="Consider dropping this column or investigating the cause of missing data",
-                        priority=1,
-                        affected_columns=[col_profile.column_name],
-                        impact="High",
-                        code_suggestion=None,
-                    )
-                )
+        insights = [
+            insight_cls(
+                severity="critical",
+                type="missing_data",
+                description=f"Column '{column_profiles[idx].column_name}' has {null_arr[idx]:.1f}% missing values",
+                recommendation="Consider dropping this column or investigating the cause of missing data",
+                priority=1,
+                affected_columns=[column_profiles[idx].column_name],
+                impact="High",
+                code_suggestion=None,
+            )
+            for idx in np.flatnonzero(null_arr > 50)
+        ]
+
+        # Warning: Outliers
+        outlier_insights = [
+            insight_cls(
+                severity="warning",
+                type="outliers",
+                description=f"Column '{column_profiles[idx].column_name}' has {outlier_arr[idx]:.1f}% outliers",
+                recommendation="Review outliers to determine if they are errors or valid extreme values",
+                priority=2,
+                affected_columns=[column_profiles[idx].column_name],
+                impact="Medium",
+                code_suggestion=None,
+            )
+            for idx in np.flatnonzero(outlier_arr > 10)
+        ]
 
         # Warning: High duplicates
         if hasattr(profile_result, "quality_metrics"):
             dup_pct = profile_result.quality_metrics.duplicate_percentage
             if dup_pct > 5:
                 insights.append(
-                    CategorizedInsight(
+                    insight_cls(
                         severity="warning",
                         type="duplicates",
                         description=f"Dataset contains {dup_pct:.1f}% duplicate rows",
@@ -273,23 +400,7 @@ class AIService:
                     )
                 )
 
-        # Warning: Outliers
-        for col_profile in profile_result.column_profiles:
-            if hasattr(col_profile, "outliers") and col_profile.outliers:
-                outlier_pct = col_profile.outliers.get("percentage", 0)
-                if outlier_pct > 10:
-                    insights.append(
-                        CategorizedInsight(
-                            severity="warning",
-                            type="outliers",
-                            description=f"Column '{col_profile.column_name}' has {outlier_pct:.1f}% outliers",
-                            recommendation="Review outliers to determine if they are errors or valid extreme values",
-                            priority=2,
-                            affected_columns=[col_profile.column_name],
-                            impact="Medium",
-                            code_suggestion=None,
-                        )
-                    )
+        insights.extend(outlier_insights)
 
         # Info: Quality summary
         quality_score = profile_result.quality_score
@@ -320,22 +431,92 @@ class AIService:
                 )
             )
 
-        # Generate code for insights
-        for insight in insights:
-            if insight.recommendation and insight.severity in {"critical", "warning"}:
-                try:
-                    code = await self.code_generator.generate(
-                        insight=insight,
-                        language="python",
-                    )
-                    insight.code_suggestion = code
-                except Exception as e:
-                    logger.warning(f"Failed to generate fallback code: {str(e)}")
+        # Generate code for insights (one batched call, same as STEP 7)
+        await self._attach_code_suggestions(insights)
 
-        logger.info(f"Generated {len(insights)} fallback insights")
+        logger.info("Generated %d fallback insights", len(insights))
 
         return insights
 
+    async def _safe_cache_set(
+        self,
+        cache_key: str,
+        insights: list[CategorizedInsight],
+        analysis_id: int,
+    ) -> None:
+        """Cache insights, swallowing errors.
+
+        Runs as a background task so the response isn't blocked by the
+        Redis round-trip. Cache failure is non-critical, log and continue.
+
+        Args:
+            cache_key: Cache key
+            insights: Insights to cache
+            analysis_id: Analysis ID (for logging)
+        """
+        try:
+            await self.cache.set(cache_key, insights)
+            logger.info("Cached insights for analysis %s", analysis_id)
+        except Exception as e:
+            logger.warning("Failed to cache insights: %s", e)
+
+    async def _attach_code_suggestions(
+        self,
+        insights: list[CategorizedInsight],
+    ) -> None:
+        """Generate code snippets for actionable insights in one batch.
+
+        Insights not served from the local code cache are sent to the
+        generator as a single generate_batch call; a failure there is
+        logged once and leaves code_suggestion None on all of them.
+
+        The insight dataclass is frozen, so updated entries are swapped
+        into the list via dataclasses.replace rather than mutated.
+
+        Args:
+            insights: Categorized insights to attach code suggestions to
+        """
+        targets: list[tuple[int, tuple]] = []
+
+        for idx, insight in enumerate(insights):
+            if not (insight.recommendation and insight.severity in _ACTIONABLE_SEVERITIES):
+                continue
+
+            key = (
+                insight.type,
+                insight.recommendation,
+                tuple(insight.affected_columns),
+                "python",
+            )
+            if key in self._code_cache:
+                insights[idx] = replace(
+                    insight, code_suggestion=self._code_cache[key]
+                )
+            else:
+                targets.append((idx, key))
+
+        if not targets:
+            return
+
+        # One batched call covers all uncached insights
+        try:
+            results = await self.code_generator.generate_batch(
+                [insights[idx] for idx, _ in targets],
+                language="python",
+            )
+        except Exception as e:
+            # code_suggestion stays None on the affected insights
+            logger.warning("Failed to generate code: %s", e)
+            return
+
+        for pos, (idx, key) in enumerate(targets):
+            code = results.get(pos)
+            insights[idx] = replace(insights[idx], code_suggestion=code)
+            if len(self._code_cache) >= self._CODE_CACHE_MAX:
+                # Evict the oldest entry (dicts preserve insertion order)
+                self._code_cache.pop(next(iter(self._code_cache)))
+            self._code_cache[key] = code
+
     def _generate_cache_key(
         self,
         analysis_id: int,
@@ -350,14 +531,13 @@ class AIService:
         Returns:
             Cache key
         """
-        # Use hash of key characteristics
-        key_data = (
-            f"{analysis_id}_"
-            f"{profile_result.row_count}_"
-            f"{profile_result.column_count}_"
-            f"{profile_result.quality_score}"
+        # Use hash of key characteristics (memoized at module level)
+        return _cache_key(
+            analysis_id,
+            profile_result.row_count,
+            profile_result.column_count,
+            profile_result.quality_score,
         )
-        return hashlib.md5(key_data.encode()).hexdigest()
 
     def get_token_stats(self) -> dict[str, Any]:
         """Get token usage statistics.
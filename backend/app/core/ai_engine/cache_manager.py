@@ -1,20 +1,99 @@
 """Cache manager for AI responses using Redis."""
 
-import hashlib
-import json
+import asyncio
+import dataclasses
 import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
+import xxhash
+import zstandard as zstd
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Shared connection pool for all Redis clients in the process. Blocking
+# variant: when every connection is busy, callers wait instead of
+# erroring, and connections are reused rather than churned per instance.
+# decode_responses stays off so payloads round-trip as bytes, and
+# redis-py picks up the C-based hiredis reply parser automatically when
+# the hiredis package is installed.
+_pool = redis.BlockingConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+    max_connections=settings.REDIS_POOL_SIZE,
+)
+
+
+def get_connection_pool() -> redis.BlockingConnectionPool:
+    """Get the shared Redis connection pool.
+
+    Returns:
+        The process-wide blocking connection pool
+    """
+    return _pool
+
+
+@lru_cache(maxsize=4096)
+def _prefixed_key(prefix: str, key: str) -> bytes:
+    """Build a prefixed cache key as bytes, memoized per key.
+
+    Hot keys skip both the f-string concatenation and the UTF-8 encode
+    redis-py would otherwise perform on every command.
+
+    Args:
+        prefix: Key namespace prefix
+        key: Bare cache key
+
+    Returns:
+        Prefixed key bytes
+    """
+    return (prefix + key).encode()
+
+
+# Per-type field names, resolved once on first sight of each insight
+# type so later conversions are straight getattr loops
+_FIELDS: dict[type, tuple[str, ...]] = {}
+
+# Server-side scan-and-unlink: one EVAL per cursor batch instead of a
+# round-trip per handful of keys. UNLINK frees memory off Redis's main
+# thread, unlike DEL.
+_CLEAR_SCRIPT = """
+local result = redis.call('SCAN', ARGV[1], 'MATCH', ARGV[2], 'COUNT', 10000)
+local cleared = 0
+for _, key in ipairs(result[2]) do
+    redis.call('UNLINK', key)
+    cleared = cleared + 1
+end
+return {result[1], cleared}
+"""
+
 
 class CacheManager:
     """Manage caching of AI responses."""
 
+    # Bound on the per-insight serialization cache
+    _SER_CACHE_MAX = 1024
+
+    # In-process L1 in front of Redis: size cap and (short) TTL in seconds
+    _L1_MAX = 1024
+    _L1_TTL = 1.0
+    # With server-push invalidation active, staleness no longer depends
+    # on the clock, so L1 entries can live much longer
+    _L1_TTL_TRACKING = 30.0
+
+    # Payloads above this size are zstd-compressed before SETEX
+    _COMPRESS_MIN = 1024
+
     def __init__(self, redis_client: redis.Redis | None = None):
         """Initialize cache manager.
 
@@ -24,16 +103,32 @@ class CacheManager:
         if redis_client:
             self.redis = redis_client
         else:
-            self.redis = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                password=settings.REDIS_PASSWORD,
-                decode_responses=True,
-            )
+            self.redis = redis.Redis(connection_pool=get_connection_pool())
 
         self.prefix = "ai_insights:"
         self.default_ttl = settings.CACHE_TTL
+        # Index sorted set tracking cached keys (scored by expiry
+        # epoch) so stats are O(1) via ZCARD instead of an O(N)
+        # keyspace scan; members whose keys have expired are pruned
+        # with ZREMRANGEBYSCORE before counting
+        self.index_key = f"{self.prefix}_index"
+        # L1 cache: repeated reads within a request burst become dict
+        # lookups instead of socket round-trips. Entries expire after
+        # _L1_TTL seconds, so cross-process invalidation lag stays short.
+        self._l1: OrderedDict[bytes, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._l1_ttl = self._L1_TTL
+        # Populated by enable_client_tracking()
+        self._invalidation_pubsub: redis.client.PubSub | None = None
+        self._invalidation_task: asyncio.Task | None = None
+        # Per-insight serialized bytes keyed by id(); the entry keeps a
+        # reference to the insight so a recycled id can never alias a
+        # different object. Saves redundant dict+JSON work when the same
+        # insight objects are cached under multiple keys.
+        self._ser_cache: dict[int, tuple[Any, bytes]] = {}
+        # zstd level 3 halves large JSON payloads at negligible CPU cost,
+        # cutting Redis memory and bytes on the wire
+        self._zctx_c = zstd.ZstdCompressor(level=3)
+        self._zctx_d = zstd.ZstdDecompressor()
 
         logger.info(
             f"CacheManager initialized with Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}"
@@ -49,12 +144,32 @@ class CacheManager:
             List of insights or None if not found
         """
         try:
-            cache_key = f"{self.prefix}{key}"
+            cache_key = _prefixed_key(self.prefix, key)
+
+            entry = self._l1.get(cache_key)
+            if entry is not None:
+                expires_at, insights = entry
+                if expires_at > time.monotonic():
+                    self._l1.move_to_end(cache_key)
+                    logger.info(f"Cache HIT (L1) for key: {key}")
+                    return insights
+                del self._l1[cache_key]
+
             cached = await self.redis.get(cache_key)
 
             if cached:
                 logger.info(f"Cache HIT for key: {key}")
-                return json.loads(cached)
+                # First byte flags compression; entries written before the
+                # flag existed start with b"[" and fall through unchanged
+                if cached[:1] == b"\x01":
+                    cached = self._zctx_d.decompress(cached[1:])
+                elif cached[:1] == b"\x00":
+                    cached = cached[1:]
+                insights = orjson.loads(cached)
+                if len(self._l1) >= self._L1_MAX:
+                    self._l1.popitem(last=False)
+                self._l1[cache_key] = (time.monotonic() + self._l1_ttl, insights)
+                return insights
 
             logger.info(f"Cache MISS for key: {key}")
             return None
@@ -77,24 +192,92 @@ class CacheManager:
             ttl: Time to live in seconds (optional)
         """
         try:
-            cache_key = f"{self.prefix}{key}"
+            cache_key = _prefixed_key(self.prefix, key)
             ttl = ttl or self.default_ttl
 
-            # Convert insights to dict format
-            insights_data = [self._insight_to_dict(i) for i in insights]
+            payload = self._serialize(insights)
 
-            # Store in Redis with expiration
-            await self.redis.setex(
-                cache_key,
-                ttl,
-                json.dumps(insights_data),
-            )
+            # Store in Redis with expiration and track the key in the
+            # index, scored by when it expires — one round-trip for both
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(cache_key, ttl, payload)
+                pipe.zadd(self.index_key, {cache_key: time.time() + ttl})
+                await pipe.execute()
+
+            self._l1.pop(cache_key, None)
 
             logger.info(f"Cached insights for key: {key} (TTL: {ttl}s)")
 
         except Exception as e:
             logger.error(f"Cache set error: {str(e)}")
 
+    async def set_many(
+        self,
+        items: list[tuple[str, list[Any], int | None]],
+    ) -> None:
+        """Cache several insight lists in one pipelined round-trip.
+
+        Sequential set() calls pay a round-trip each; when multiple
+        analyses complete together, this batches every SETEX and index
+        ZADD into a single pipeline.
+
+        Args:
+            items: (key, insights, ttl) triples; a None ttl uses the
+                default TTL
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, insights, ttl in items:
+                    cache_key = _prefixed_key(self.prefix, key)
+                    effective_ttl = ttl or self.default_ttl
+                    pipe.setex(
+                        cache_key,
+                        effective_ttl,
+                        self._serialize(insights),
+                    )
+                    pipe.zadd(
+                        self.index_key, {cache_key: time.time() + effective_ttl}
+                    )
+                    self._l1.pop(cache_key, None)
+                await pipe.execute()
+
+            logger.info(f"Cached {len(items)} insight lists in one batch")
+
+        except Exception as e:
+            logger.error(f"Cache set_many error: {str(e)}")
+
+    def _serialize(self, insights: list[Any]) -> bytes:
+        """Serialize an insight list to its stored payload bytes.
+
+        Each insight is encoded once, reusing bytes for objects seen
+        before, and the joined payload is compressed when large.
+
+        Args:
+            insights: List of insights to serialize
+
+        Returns:
+            Payload bytes with the compression flag prefix
+        """
+        parts: list[bytes] = []
+        for insight in insights:
+            entry = self._ser_cache.get(id(insight))
+            if entry is not None and entry[0] is insight:
+                parts.append(entry[1])
+                continue
+            part = orjson.dumps(
+                self._insight_to_dict(insight),
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+            if len(self._ser_cache) >= self._SER_CACHE_MAX:
+                self._ser_cache.pop(next(iter(self._ser_cache)))
+            self._ser_cache[id(insight)] = (insight, part)
+            parts.append(part)
+
+        payload = b"[" + b",".join(parts) + b"]"
+        if len(payload) > self._COMPRESS_MIN:
+            return b"\x01" + self._zctx_c.compress(payload)
+        return b"\x00" + payload
+
     async def delete(self, key: str) -> None:
         """Delete cached insights.
 
@@ -102,8 +285,12 @@ class CacheManager:
             key: Cache key
         """
         try:
-            cache_key = f"{self.prefix}{key}"
-            await self.redis.delete(cache_key)
+            cache_key = _prefixed_key(self.prefix, key)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.delete(cache_key)
+                pipe.zrem(self.index_key, cache_key)
+                await pipe.execute()
+            self._l1.pop(cache_key, None)
             logger.info(f"Deleted cache for key: {key}")
 
         except Exception as e:
@@ -112,22 +299,94 @@ class CacheManager:
     async def clear_all(self) -> None:
         """Clear all cached insights."""
         try:
-            # Find all keys with our prefix
+            # Scan and unlink server-side, looping on the returned cursor.
+            # The index shares the prefix, so it is unlinked too.
             pattern = f"{self.prefix}*"
-            keys = []
+            cursor = b"0"
+            cleared = 0
+
+            while True:
+                cursor, batch_cleared = await self.redis.eval(
+                    _CLEAR_SCRIPT, 0, cursor, pattern
+                )
+                cleared += batch_cleared
+                if cursor in (b"0", "0", 0):
+                    break
 
-            async for key in self.redis.scan_iter(match=pattern):
-                keys.append(key)
+            self._l1.clear()
 
-            if keys:
-                await self.redis.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cached insights")
+            if cleared:
+                logger.info(f"Cleared {cleared} cached insights")
             else:
                 logger.info("No cached insights to clear")
 
         except Exception as e:
             logger.error(f"Cache clear error: {str(e)}")
 
+    async def enable_client_tracking(self) -> None:
+        """Enable server-push invalidation for the L1 cache (Redis 6+).
+
+        Broadcast tracking is redirected to a dedicated pub/sub
+        connection: Redis pushes an invalidation message for any write
+        to a key under our prefix, regardless of which connection wrote
+        it, and the listener evicts the matching L1 entry. With pushes
+        active the L1 TTL stretches from 1s to 30s since staleness no
+        longer depends on the clock.
+
+        No-op unless REDIS_CLIENT_TRACKING is set — tracking support in
+        redis-py is still maturing, so this stays opt-in.
+        """
+        if not settings.REDIS_CLIENT_TRACKING:
+            return
+
+        try:
+            # The connection ID must be read before SUBSCRIBE: a RESP2
+            # connection in subscribed mode rejects CLIENT, and
+            # PubSub.execute_command only sends (replies are consumed by
+            # the message loop). Send the command on the raw connection
+            # while it is still in normal request/response mode.
+            pubsub = self.redis.pubsub()
+            await pubsub.connect()
+            conn = pubsub.connection
+            await conn.send_command("CLIENT", "ID")
+            conn_id = await conn.read_response()
+
+            await self.redis.execute_command(
+                "CLIENT",
+                "TRACKING",
+                "ON",
+                "REDIRECT",
+                conn_id,
+                "BCAST",
+                "PREFIX",
+                self.prefix,
+            )
+            await pubsub.subscribe("__redis__:invalidate")
+            self._invalidation_pubsub = pubsub
+
+            self._l1_ttl = self._L1_TTL_TRACKING
+            self._invalidation_task = asyncio.create_task(
+                self._invalidation_listener()
+            )
+            logger.info("Redis client tracking enabled")
+
+        except Exception as e:
+            logger.error(f"Failed to enable client tracking: {str(e)}")
+
+    async def _invalidation_listener(self) -> None:
+        """Evict L1 entries named in server invalidation pushes."""
+        async for message in self._invalidation_pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            data = message.get("data")
+            if not isinstance(data, (list, tuple)):
+                data = [data]
+            for key in data:
+                # L1 keys are prefixed bytes, matching the raw push payload
+                if isinstance(key, str):
+                    key = key.encode()
+                self._l1.pop(key, None)
+
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
@@ -135,15 +394,15 @@ class CacheManager:
             Dictionary with cache stats
         """
         try:
-            # Count keys with our prefix
-            pattern = f"{self.prefix}*"
-            count = 0
-
-            async for _ in self.redis.scan_iter(match=pattern):
-                count += 1
-
-            # Get Redis info
-            info = await self.redis.info("stats")
+            # The index makes the count an O(1) ZCARD instead of a
+            # scan. Members whose SETEX'd keys have lapsed are pruned
+            # by expiry score first, so the count tracks the live
+            # keyspace; all three commands share one round-trip.
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(self.index_key, "-inf", time.time())
+                pipe.zcard(self.index_key)
+                pipe.info("stats")
+                _, count, info = await pipe.execute()
 
             return {
                 "cached_insights_count": count,
@@ -169,8 +428,10 @@ class CacheManager:
         Returns:
             Cache key
         """
+        # xxh3 is a non-cryptographic hash; for these tiny inputs it avoids
+        # the per-call OpenSSL dispatch that hashlib.md5 pays
         key_data = f"{analysis_id}_{profile_hash}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return xxhash.xxh3_64_hexdigest(key_data)
 
     def _insight_to_dict(self, insight: Any) -> dict[str, Any]:
         """Convert insight object to dictionary.
@@ -181,14 +442,22 @@ class CacheManager:
         Returns:
             Dictionary representation
         """
-        if hasattr(insight, "__dict__"):
-            return {
-                k: v
-                for k, v in insight.__dict__.items()
-                if not k.startswith("_")
-            }
-        else:
-            return dict(insight)
+        insight_type = type(insight)
+        fields = _FIELDS.get(insight_type)
+
+        if fields is None:
+            if dataclasses.is_dataclass(insight):
+                # Slotted dataclasses have no __dict__
+                fields = tuple(f.name for f in dataclasses.fields(insight_type))
+            elif hasattr(insight, "__dict__"):
+                fields = tuple(
+                    k for k in insight.__dict__ if not k.startswith("_")
+                )
+            else:
+                return dict(insight)
+            _FIELDS[insight_type] = fields
+
+        return {f: getattr(insight, f) for f in fields}
 
     def _calculate_hit_rate(self, hits: int, misses: int) -> float:
         """Calculate cache hit rate.
@@ -208,6 +477,10 @@ class CacheManager:
     async def close(self) -> None:
         """Close Redis connection."""
         try:
+            if self._invalidation_task:
+                self._invalidation_task.cancel()
+            if self._invalidation_pubsub:
+                await self._invalidation_pubsub.close()
             await self.redis.close()
             logger.info("Redis connection closed")
         except Exception as e:
@@ -8,7 +8,7 @@ This module provides a robust wrapper around the Anthropic Claude API with:
 
 RETRY STRATEGY:
 - 3 retry attempts
-- Exponential backoff: 2s, 4s, 8s
+- Exponential backoff with jitter (up to 10s)
 - Only retries on rate limits and timeouts
 - Other errors fail immediately
 
@@ -24,21 +24,41 @@ EXAMPLE USAGE:
     print(f"Cost: ${stats['estimated_cost_usd']}")
 """
 
+import asyncio
 import logging
+import threading
+from collections.abc import AsyncIterator
 from typing import Any
 
 import anthropic
 from tenacity import (
-    retry,
+    AsyncRetrying,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Shared retry policy, built once at import instead of a fresh state
+# machine per call. Jitter spreads concurrent retries so simultaneous
+# rate-limited requests don't all come back at the same instant.
+# reraise=True surfaces the original anthropic error after the final
+# attempt so generate()'s handlers can classify it.
+_RETRYER = AsyncRetrying(
+    stop=stop_after_attempt(3),  # Try up to 3 times
+    wait=wait_exponential_jitter(initial=1, max=10),
+    retry=retry_if_exception_type(
+        # Only retry on these specific errors
+        (anthropic.RateLimitError, anthropic.APITimeoutError)
+    ),
+    reraise=True,
+)
+
 
 class TokenUsageTracker:
     """Track Claude API token usage for cost monitoring."""
@@ -47,6 +67,9 @@ class TokenUsageTracker:
         """Initialize token usage tracker."""
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        # Keeps the counter pair consistent without relying on the GIL
+        # making the two += operations atomic
+        self._lock = threading.Lock()
 
     def add(self, input_tokens: int, output_tokens: int) -> None:
         """Add token usage from an API call.
@@ -55,12 +78,20 @@ class TokenUsageTracker:
             input_tokens: Number of input tokens used
             output_tokens: Number of output tokens generated
         """
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        logger.info(
-            f"Token usage - Input: {input_tokens}, Output: {output_tokens}, "
-            f"Total: {self.total_input_tokens + self.total_output_tokens}"
-        )
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            total = self.total_input_tokens + self.total_output_tokens
+
+        # Per-call accounting is debug-level noise; the isEnabledFor
+        # guard skips even the argument packing when it's off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Token usage - Input: %d, Output: %d, Total: %d",
+                input_tokens,
+                output_tokens,
+                total,
+            )
 
     def get_cost(self) -> float:
         """Calculate approximate cost in USD.
@@ -96,6 +127,11 @@ class ClaudeAPIException(Exception):
 class ClaudeClient:
     """Claude API client with retry and error handling."""
 
+    # Coalescing queue: prompts arriving within this window are submitted
+    # together over the SDK's pooled HTTP connection
+    _BATCH_MAX = 16
+    _BATCH_WINDOW = 0.01  # seconds
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -119,16 +155,102 @@ class ClaudeClient:
         self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
         self.token_usage = TokenUsageTracker()
 
+        # Batch queue and worker are created lazily on the first
+        # generate_batched call, once an event loop is running
+        self._queue: (
+            asyncio.Queue[tuple[str, int | None, float | None, asyncio.Future[str]]]
+            | None
+        ) = None
+        self._batch_task: asyncio.Task | None = None
+
         logger.info(f"Initialized ClaudeClient with model: {self.model}")
 
-    @retry(
-        stop=stop_after_attempt(3),  # Try up to 3 times
-        wait=wait_exponential(multiplier=1, min=2, max=10),  # Wait 2s, 4s, 8s between retries
-        retry=retry_if_exception_type(
-            # Only retry on these specific errors
-            (anthropic.RateLimitError, anthropic.APITimeoutError)
-        ),
-    )
+    async def generate_batched(
+        self,
+        prompt: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """Generate a response through the coalescing batch queue.
+
+        Concurrent callers that land within the same 10 ms window are
+        submitted together as parallel requests over the SDK's pooled
+        connection, amortizing TLS and connection setup. A lone caller
+        only pays the window wait when a second request is pending.
+
+        Args:
+            prompt: Input prompt (will be sent to Claude)
+            max_tokens: Maximum tokens in response (overrides default)
+            temperature: Sampling temperature 0-1 (overrides default)
+
+        Returns:
+            Generated text response from Claude
+
+        Raises:
+            ClaudeAPIException: If the underlying API call fails
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((prompt, max_tokens, temperature, future))
+        return await future
+
+    async def _batch_worker(self) -> None:
+        """Drain queued prompts in short windows and submit them in parallel.
+
+        Each collected batch is dispatched as its own task so the
+        worker goes straight back to draining the queue - a slow batch
+        (one request stuck in retry backoff) doesn't hold later
+        arrivals hostage to its completion.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Block for the first item, then coalesce whatever else
+            # arrives before the window closes
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._BATCH_WINDOW
+
+            while len(batch) < self._BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) > 1:
+                logger.info(f"Submitting batch of {len(batch)} Claude requests")
+
+            asyncio.create_task(self._dispatch_batch(batch))
+
+    async def _dispatch_batch(
+        self,
+        batch: list[tuple[str, int | None, float | None, asyncio.Future[str]]],
+    ) -> None:
+        """Run one batch's requests in parallel and resolve their futures.
+
+        Args:
+            batch: (prompt, max_tokens, temperature, future) tuples
+        """
+        results = await asyncio.gather(
+            *(self.generate(p, mt, t) for p, mt, t, _ in batch),
+            return_exceptions=True,
+        )
+
+        for (_, _, _, future), result in zip(batch, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     async def generate(
         self,
         prompt: str,
@@ -141,8 +263,8 @@ class ClaudeClient:
         and timeouts. Token usage is tracked for cost monitoring.
         
         RETRY BEHAVIOR:
-        - RateLimitError: Retries with exponential backoff (2s, 4s, 8s)
-        - APITimeoutError: Retries with exponential backoff
+        - RateLimitError: Retries with jittered exponential backoff
+        - APITimeoutError: Retries with jittered exponential backoff
         - Other errors: Fails immediately without retry
         
         COST TRACKING:
@@ -171,45 +293,21 @@ class ClaudeClient:
                               - Other API errors (immediate failure)
         """
         try:
-            logger.info(f"Calling Claude API with prompt length: {len(prompt)} characters")
-
-            # Call Claude API using Anthropic SDK
-            # This is an async call that may take several seconds
-            response = await self.client.messages.create(
-                model=self.model,  # claude-sonnet-4-20250514
-                max_tokens=max_tokens or self.max_tokens,  # Default: 2000
-                temperature=temperature or self.temperature,  # Default: 0.7
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Track token usage for cost monitoring
-            # Input tokens: ~$0.003 per 1K tokens
-            # Output tokens: ~$0.015 per 1K tokens
-            self.token_usage.add(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
-
-            # Extract text from response
-            # Claude returns a list of content blocks, we take the first text block
-            text_response = response.content[0].text
-
-            logger.info(
-                f"Claude API response received: {len(text_response)} characters, "
-                f"{response.usage.input_tokens} input tokens, "
-                f"{response.usage.output_tokens} output tokens"
-            )
-
-            return text_response
+            # Drive the shared retry policy; each attempt re-enters the
+            # raw API call, and retryable errors propagate out of the
+            # `with attempt` block for the state machine to classify
+            async for attempt in _RETRYER.copy():
+                with attempt:
+                    return await self._generate_once(prompt, max_tokens, temperature)
 
         except anthropic.RateLimitError as e:
-            # Rate limit hit - will be retried automatically by @retry decorator
-            logger.warning(f"Rate limit exceeded: {str(e)} - will retry")
+            # Rate limit still exceeded after all retries
+            logger.warning(f"Rate limit exceeded: {str(e)}")
             raise ClaudeAPIException(f"Rate limit exceeded: {str(e)}")
 
         except anthropic.APITimeoutError as e:
-            # Timeout - will be retried automatically by @retry decorator
-            logger.warning(f"API timeout: {str(e)} - will retry")
+            # Timed out after all retries
+            logger.warning(f"API timeout: {str(e)}")
             raise ClaudeAPIException(f"API timeout: {str(e)}")
 
         except anthropic.APIError as e:
@@ -222,6 +320,103 @@ class ClaudeClient:
             logger.error(f"Unexpected error calling Claude API: {str(e)}")
             raise ClaudeAPIException(f"Unexpected error: {str(e)}")
 
+        # Unreachable: the retry loop either returns or raises
+        raise ClaudeAPIException("Claude API call failed")
+
+    async def _generate_once(
+        self,
+        prompt: str,
+        max_tokens: int | None,
+        temperature: float | None,
+    ) -> str:
+        """Make a single Claude API call without retry handling.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens in response (None uses the default)
+            temperature: Sampling temperature (None uses the default)
+
+        Returns:
+            Generated text response from Claude
+        """
+        logger.info(f"Calling Claude API with prompt length: {len(prompt)} characters")
+
+        # Call Claude API using Anthropic SDK
+        # This is an async call that may take several seconds
+        response = await self.client.messages.create(
+            model=self.model,  # claude-sonnet-4-20250514
+            max_tokens=max_tokens or self.max_tokens,  # Default: 2000
+            temperature=temperature or self.temperature,  # Default: 0.7
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        # Track token usage for cost monitoring
+        # Input tokens: ~$0.003 per 1K tokens
+        # Output tokens: ~$0.015 per 1K tokens
+        self.token_usage.add(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+
+        # Extract text from response
+        # Claude returns a list of content blocks, we take the first text block
+        text_response = response.content[0].text
+
+        logger.info(
+            f"Claude API response received: {len(text_response)} characters, "
+            f"{response.usage.input_tokens} input tokens, "
+            f"{response.usage.output_tokens} output tokens"
+        )
+
+        return text_response
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a Claude response as text chunks.
+
+        Downstream work (parsing, validation, relaying to a websocket)
+        can overlap with generation instead of waiting for the final
+        token, cutting end-to-end wall time for long responses. Token
+        usage is tracked once the stream completes.
+
+        Args:
+            prompt: Input prompt (will be sent to Claude)
+            max_tokens: Maximum tokens in response (overrides default)
+            temperature: Sampling temperature 0-1 (overrides default)
+
+        Yields:
+            Text chunks as they arrive from the API
+
+        Raises:
+            ClaudeAPIException: If the API call fails
+        """
+        logger.info(f"Streaming Claude API response for prompt length: {len(prompt)}")
+
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temperature or self.temperature,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+                message = await stream.get_final_message()
+
+            self.token_usage.add(
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+            )
+
+        except anthropic.APIError as e:
+            logger.error(f"Claude API streaming error: {str(e)}")
+            raise ClaudeAPIException(f"Streaming call failed: {str(e)}")
+
     def get_token_stats(self) -> dict[str, Any]:
         """Get token usage statistics.
 
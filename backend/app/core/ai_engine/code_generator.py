@@ -1,71 +1,51 @@
 """Code generator for creating Python and SQL snippets."""
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Fixed vocabulary of quality-issue tags looked for in descriptions
+_QUALITY_TAGS = ("correlation", "cardinality")
 
-class CodeGenerator:
-    """Generate code snippets for recommendations."""
-
-    async def generate(
-        self,
-        insight: Any,
-        language: str = "python",
-    ) -> str | None:
-        """Generate code snippet for insight.
 
-        Args:
-            insight: Insight with recommendation
-            language: Target language (python, sql, r)
+@lru_cache(maxsize=1024)
+def _extract_tags(description: str) -> frozenset[str]:
+    """Extract known quality tags from an insight description.
 
-        Returns:
-            Code snippet or None
-        """
-        logger.info(f"Generating {language} code for insight type: {insight.type}")
-
-        if language == "python":
-            return self._generate_python(insight)
-        elif language == "sql":
-            return self._generate_sql(insight)
-        elif language == "r":
-            return self._generate_r(insight)
-        else:
-            logger.warning(f"Unsupported language: {language}")
-            return None
+    Memoized per unique description, so repeated renders of the same
+    insight pay the lowercase+scan only once.
 
-    def _generate_python(self, insight: Any) -> str | None:
-        """Generate Python code snippet.
+    Args:
+        description: Insight description text
 
-        Args:
-            insight: Insight object
+    Returns:
+        Set of recognized tags present in the description
+    """
+    lowered = description.lower()
+    return frozenset(tag for tag in _QUALITY_TAGS if tag in lowered)
 
-        Returns:
-            Python code snippet
-        """
-        insight_type = insight.type
-        affected_cols = insight.affected_columns
 
-        if insight_type == "missing_data":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Handle missing values in '{col}'
+# Snippet templates, built once at import. %-style named placeholders
+# make rendering a single C-level format instead of rebuilding an
+# f-string chain per call; literal % signs are escaped as %%.
+_PY_TEMPLATES: dict[str, str] = {
+    "missing_data_col": """# Handle missing values in '%(col)s'
 import pandas as pd
 
 # Option 1: Remove rows with missing values
-df = df.dropna(subset=['{col}'])
+df = df.dropna(subset=['%(col)s'])
 
 # Option 2: Fill with median (for numeric columns)
-df['{col}'].fillna(df['{col}'].median(), inplace=True)
+df['%(col)s'].fillna(df['%(col)s'].median(), inplace=True)
 
 # Option 3: Fill with mode (for categorical columns)
-df['{col}'].fillna(df['{col}'].mode()[0], inplace=True)
+df['%(col)s'].fillna(df['%(col)s'].mode()[0], inplace=True)
 
 # Option 4: Forward fill
-df['{col}'].fillna(method='ffill', inplace=True)"""
-            else:
-                return """# Handle missing values
+df['%(col)s'].fillna(method='ffill', inplace=True)""",
+    "missing_data": """# Handle missing values
 import pandas as pd
 
 # Remove all rows with any missing values
@@ -76,10 +56,8 @@ df = df.dropna(how='all')
 
 # Fill all numeric columns with median
 numeric_cols = df.select_dtypes(include=['number']).columns
-df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())"""
-
-        elif insight_type == "duplicates":
-            return """# Remove duplicate rows
+df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())""",
+    "duplicates": """# Remove duplicate rows
 import pandas as pd
 
 # Remove all duplicate rows
@@ -92,18 +70,14 @@ df = df.drop_duplicates(keep='first')
 df = df.drop_duplicates(keep='last')
 
 # Remove duplicates based on specific columns
-# df = df.drop_duplicates(subset=['column1', 'column2'])"""
-
-        elif insight_type == "outliers":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Remove outliers from '{col}' using IQR method
+# df = df.drop_duplicates(subset=['column1', 'column2'])""",
+    "outliers_col": """# Remove outliers from '%(col)s' using IQR method
 import pandas as pd
 import numpy as np
 
 # Calculate IQR
-Q1 = df['{col}'].quantile(0.25)
-Q3 = df['{col}'].quantile(0.75)
+Q1 = df['%(col)s'].quantile(0.25)
+Q3 = df['%(col)s'].quantile(0.75)
 IQR = Q3 - Q1
 
 # Define outlier bounds
@@ -111,12 +85,11 @@ lower_bound = Q1 - 1.5 * IQR
 upper_bound = Q3 + 1.5 * IQR
 
 # Remove outliers
-df = df[(df['{col}'] >= lower_bound) & (df['{col}'] <= upper_bound)]
+df = df[(df['%(col)s'] >= lower_bound) & (df['%(col)s'] <= upper_bound)]
 
 # Or cap outliers instead of removing
-df['{col}'] = df['{col}'].clip(lower=lower_bound, upper=upper_bound)"""
-            else:
-                return """# Remove outliers using Z-score method
+df['%(col)s'] = df['%(col)s'].clip(lower=lower_bound, upper=upper_bound)""",
+    "outliers": """# Remove outliers using Z-score method
 import pandas as pd
 import numpy as np
 
@@ -125,27 +98,22 @@ numeric_cols = df.select_dtypes(include=['number']).columns
 z_scores = np.abs((df[numeric_cols] - df[numeric_cols].mean()) / df[numeric_cols].std())
 
 # Remove rows where any column has |z-score| > 3
-df = df[(z_scores < 3).all(axis=1)]"""
-
-        elif insight_type == "data_type_mismatch":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Convert data type for '{col}'
+df = df[(z_scores < 3).all(axis=1)]""",
+    "data_type_mismatch_col": """# Convert data type for '%(col)s'
 import pandas as pd
 
 # Convert to numeric (coerce errors to NaN)
-df['{col}'] = pd.to_numeric(df['{col}'], errors='coerce')
+df['%(col)s'] = pd.to_numeric(df['%(col)s'], errors='coerce')
 
 # Convert to datetime
-df['{col}'] = pd.to_datetime(df['{col}'], errors='coerce')
+df['%(col)s'] = pd.to_datetime(df['%(col)s'], errors='coerce')
 
 # Convert to string
-df['{col}'] = df['{col}'].astype(str)
+df['%(col)s'] = df['%(col)s'].astype(str)
 
 # Convert to category (for categorical data)
-df['{col}'] = df['{col}'].astype('category')"""
-            else:
-                return """# Fix data type mismatches
+df['%(col)s'] = df['%(col)s'].astype('category')""",
+    "data_type_mismatch": """# Fix data type mismatches
 import pandas as pd
 
 # Infer and convert data types automatically
@@ -153,90 +121,61 @@ df = df.infer_objects()
 
 # Convert specific columns
 # df['numeric_col'] = pd.to_numeric(df['numeric_col'], errors='coerce')
-# df['date_col'] = pd.to_datetime(df['date_col'], errors='coerce')"""
-
-        elif insight_type == "pattern_violation":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Standardize format for '{col}'
+# df['date_col'] = pd.to_datetime(df['date_col'], errors='coerce')""",
+    "pattern_violation_col": """# Standardize format for '%(col)s'
 import pandas as pd
 import re
 
 # Remove special characters
-df['{col}'] = df['{col}'].str.replace(r'[^a-zA-Z0-9\\s]', '', regex=True)
+df['%(col)s'] = df['%(col)s'].str.replace(r'[^a-zA-Z0-9\\s]', '', regex=True)
 
 # Convert to lowercase
-df['{col}'] = df['{col}'].str.lower()
+df['%(col)s'] = df['%(col)s'].str.lower()
 
 # Trim whitespace
-df['{col}'] = df['{col}'].str.strip()
+df['%(col)s'] = df['%(col)s'].str.strip()
 
 # Apply custom pattern (example: phone numbers)
-# df['{col}'] = df['{col}'].str.replace(r'(\\d{{3}})(\\d{{3}})(\\d{{4}})', r'\\1-\\2-\\3', regex=True)"""
-            else:
-                return """# Standardize text formatting
+# df['%(col)s'] = df['%(col)s'].str.replace(r'(\\d{3})(\\d{3})(\\d{4})', r'\\1-\\2-\\3', regex=True)""",
+    "pattern_violation": """# Standardize text formatting
 import pandas as pd
 
 # Standardize all text columns
 text_cols = df.select_dtypes(include=['object']).columns
 for col in text_cols:
-    df[col] = df[col].str.strip().str.lower()"""
-
-        elif insight_type == "quality_issue":
-            # Check if it's about high correlation
-            if "correlation" in insight.description.lower():
-                if affected_cols and len(affected_cols) >= 2:
-                    col1, col2 = affected_cols[0], affected_cols[1]
-                    return f"""# Handle high correlation between '{col1}' and '{col2}'
+    df[col] = df[col].str.strip().str.lower()""",
+    "correlation": """# Handle high correlation between '%(col1)s' and '%(col2)s'
 import pandas as pd
 
 # Option 1: Remove one of the correlated features
-df = df.drop(columns=['{col2}'])
+df = df.drop(columns=['%(col2)s'])
 
 # Option 2: Create a combined feature
-df['{col1}_{col2}_combined'] = df['{col1}'] + df['{col2}']
-df = df.drop(columns=['{col1}', '{col2}'])
+df['%(col1)s_%(col2)s_combined'] = df['%(col1)s'] + df['%(col2)s']
+df = df.drop(columns=['%(col1)s', '%(col2)s'])
 
 # Option 3: Use PCA to reduce dimensionality
 from sklearn.decomposition import PCA
 pca = PCA(n_components=1)
-df['{col1}_{col2}_pca'] = pca.fit_transform(df[['{col1}', '{col2}']])
-df = df.drop(columns=['{col1}', '{col2}'])"""
-
-            # Check if it's about high cardinality
-            elif "cardinality" in insight.description.lower():
-                if affected_cols:
-                    col = affected_cols[0]
-                    return f"""# Reduce high cardinality in '{col}'
+df['%(col1)s_%(col2)s_pca'] = pca.fit_transform(df[['%(col1)s', '%(col2)s']])
+df = df.drop(columns=['%(col1)s', '%(col2)s'])""",
+    "cardinality": """# Reduce high cardinality in '%(col)s'
 import pandas as pd
 
 # Option 1: Keep only top N categories
 top_n = 10
-top_categories = df['{col}'].value_counts().head(top_n).index
-df['{col}'] = df['{col}'].apply(lambda x: x if x in top_categories else 'Other')
+top_categories = df['%(col)s'].value_counts().head(top_n).index
+df['%(col)s'] = df['%(col)s'].apply(lambda x: x if x in top_categories else 'Other')
 
 # Option 2: Group rare categories
-min_frequency = 0.01  # 1%
-value_counts = df['{col}'].value_counts(normalize=True)
+min_frequency = 0.01  # 1%%
+value_counts = df['%(col)s'].value_counts(normalize=True)
 rare_categories = value_counts[value_counts < min_frequency].index
-df['{col}'] = df['{col}'].apply(lambda x: 'Other' if x in rare_categories else x)"""
-
-        return None
-
-    def _generate_sql(self, insight: Any) -> str | None:
-        """Generate SQL code snippet.
-
-        Args:
-            insight: Insight object
-
-        Returns:
-            SQL code snippet
-        """
-        insight_type = insight.type
-        affected_cols = insight.affected_columns
+df['%(col)s'] = df['%(col)s'].apply(lambda x: 'Other' if x in rare_categories else x)""",
+}
 
-        if insight_type == "duplicates":
-            return """-- Remove duplicate rows (PostgreSQL)
+_SQL_TEMPLATES: dict[str, str] = {
+    "duplicates": """-- Remove duplicate rows (PostgreSQL)
 DELETE FROM table_name
 WHERE ctid NOT IN (
     SELECT MIN(ctid)
@@ -251,28 +190,23 @@ WITH ranked AS (
     FROM table_name
 )
 DELETE FROM table_name
-WHERE id IN (SELECT id FROM ranked WHERE rn > 1);"""
-
-        elif insight_type == "missing_data":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""-- Handle NULL values in '{col}'
+WHERE id IN (SELECT id FROM ranked WHERE rn > 1);""",
+    "missing_data_col": """-- Handle NULL values in '%(col)s'
 
 -- Option 1: Remove rows with NULL
 DELETE FROM table_name
-WHERE {col} IS NULL;
+WHERE %(col)s IS NULL;
 
 -- Option 2: Update with default value
 UPDATE table_name
-SET {col} = 0  -- or appropriate default
-WHERE {col} IS NULL;
+SET %(col)s = 0  -- or appropriate default
+WHERE %(col)s IS NULL;
 
 -- Option 3: Update with average (for numeric columns)
 UPDATE table_name
-SET {col} = (SELECT AVG({col}) FROM table_name WHERE {col} IS NOT NULL)
-WHERE {col} IS NULL;"""
-            else:
-                return """-- Handle NULL values
+SET %(col)s = (SELECT AVG(%(col)s) FROM table_name WHERE %(col)s IS NOT NULL)
+WHERE %(col)s IS NULL;""",
+    "missing_data": """-- Handle NULL values
 
 -- Remove rows where any key column is NULL
 DELETE FROM table_name
@@ -282,18 +216,14 @@ WHERE column1 IS NULL
 
 -- Update NULLs with defaults
 UPDATE table_name
-SET column1 = COALESCE(column1, 'default_value');"""
-
-        elif insight_type == "outliers":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""-- Remove outliers from '{col}' using IQR method
+SET column1 = COALESCE(column1, 'default_value');""",
+    "outliers_col": """-- Remove outliers from '%(col)s' using IQR method
 
 -- Calculate quartiles
 WITH quartiles AS (
     SELECT
-        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {col}) AS q1,
-        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {col}) AS q3
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY %(col)s) AS q1,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY %(col)s) AS q3
     FROM table_name
 ),
 bounds AS (
@@ -304,59 +234,38 @@ bounds AS (
 )
 -- Remove outliers
 DELETE FROM table_name
-WHERE {col} < (SELECT lower_bound FROM bounds)
-   OR {col} > (SELECT upper_bound FROM bounds);"""
+WHERE %(col)s < (SELECT lower_bound FROM bounds)
+   OR %(col)s > (SELECT upper_bound FROM bounds);""",
+}
 
-        return None
-
-    def _generate_r(self, insight: Any) -> str | None:
-        """Generate R code snippet.
-
-        Args:
-            insight: Insight object
-
-        Returns:
-            R code snippet
-        """
-        insight_type = insight.type
-        affected_cols = insight.affected_columns
-
-        if insight_type == "missing_data":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Handle missing values in '{col}'
+_R_TEMPLATES: dict[str, str] = {
+    "missing_data_col": """# Handle missing values in '%(col)s'
 library(dplyr)
 
 # Option 1: Remove rows with missing values
-df <- df %>% filter(!is.na({col}))
+df <- df %%>%% filter(!is.na(%(col)s))
 
 # Option 2: Fill with median
-df <- df %>%
-  mutate({col} = ifelse(is.na({col}), median({col}, na.rm = TRUE), {col}))
+df <- df %%>%%
+  mutate(%(col)s = ifelse(is.na(%(col)s), median(%(col)s, na.rm = TRUE), %(col)s))
 
 # Option 3: Fill with mode
-mode_value <- names(sort(table(df${col}), decreasing = TRUE))[1]
-df${col}[is.na(df${col})] <- mode_value"""
-
-        elif insight_type == "duplicates":
-            return """# Remove duplicate rows
+mode_value <- names(sort(table(df$%(col)s), decreasing = TRUE))[1]
+df$%(col)s[is.na(df$%(col)s)] <- mode_value""",
+    "duplicates": """# Remove duplicate rows
 library(dplyr)
 
 # Remove all duplicates
 df <- df %>% distinct()
 
 # Remove duplicates based on specific columns
-# df <- df %>% distinct(column1, column2, .keep_all = TRUE)"""
-
-        elif insight_type == "outliers":
-            if affected_cols:
-                col = affected_cols[0]
-                return f"""# Remove outliers from '{col}' using IQR method
+# df <- df %>% distinct(column1, column2, .keep_all = TRUE)""",
+    "outliers_col": """# Remove outliers from '%(col)s' using IQR method
 library(dplyr)
 
 # Calculate IQR
-Q1 <- quantile(df${col}, 0.25, na.rm = TRUE)
-Q3 <- quantile(df${col}, 0.75, na.rm = TRUE)
+Q1 <- quantile(df$%(col)s, 0.25, na.rm = TRUE)
+Q3 <- quantile(df$%(col)s, 0.75, na.rm = TRUE)
 IQR <- Q3 - Q1
 
 # Define bounds
@@ -364,7 +273,262 @@ lower_bound <- Q1 - 1.5 * IQR
 upper_bound <- Q3 + 1.5 * IQR
 
 # Remove outliers
-df <- df %>%
-  filter({col} >= lower_bound & {col} <= upper_bound)"""
+df <- df %%>%%
+  filter(%(col)s >= lower_bound & %(col)s <= upper_bound)""",
+}
+
+
+def _py_missing_data(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _PY_TEMPLATES["missing_data_col"] % {
+            "col": cols[0]
+        }
+    return _PY_TEMPLATES["missing_data"]
+
+
+def _py_duplicates(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    return _PY_TEMPLATES["duplicates"]
+
+
+def _py_outliers(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _PY_TEMPLATES["outliers_col"] % {"col": cols[0]}
+    return _PY_TEMPLATES["outliers"]
+
+
+def _py_data_type_mismatch(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _PY_TEMPLATES["data_type_mismatch_col"] % {
+            "col": cols[0]
+        }
+    return _PY_TEMPLATES["data_type_mismatch"]
+
+
+def _py_pattern_violation(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _PY_TEMPLATES["pattern_violation_col"] % {
+            "col": cols[0]
+        }
+    return _PY_TEMPLATES["pattern_violation"]
+
+
+def _py_quality_issue(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    # Check if it's about high correlation
+    if "correlation" in tags:
+        if len(cols) >= 2:
+            return _PY_TEMPLATES["correlation"] % {
+                "col1": cols[0],
+                "col2": cols[1],
+            }
+
+    # Check if it's about high cardinality
+    elif "cardinality" in tags:
+        if cols:
+            return _PY_TEMPLATES["cardinality"] % {"col": cols[0]}
+
+    return None
+
+
+def _sql_duplicates(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    return _SQL_TEMPLATES["duplicates"]
+
+
+def _sql_missing_data(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _SQL_TEMPLATES["missing_data_col"] % {
+            "col": cols[0]
+        }
+    return _SQL_TEMPLATES["missing_data"]
+
+
+def _sql_outliers(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _SQL_TEMPLATES["outliers_col"] % {"col": cols[0]}
+    return None
+
+
+def _r_missing_data(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _R_TEMPLATES["missing_data_col"] % {"col": cols[0]}
+    return None
+
+
+def _r_duplicates(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    return _R_TEMPLATES["duplicates"]
+
+
+def _r_outliers(cols: tuple[str, ...], tags: frozenset[str]) -> str | None:
+    if cols:
+        return _R_TEMPLATES["outliers_col"] % {"col": cols[0]}
+    return None
 
-        return None
+
+# Dispatch tables: one dict lookup per insight type instead of walking
+# an if/elif chain per call
+_HANDLERS: dict[str, dict[str, Any]] = {
+    "python": {
+        "missing_data": _py_missing_data,
+        "duplicates": _py_duplicates,
+        "outliers": _py_outliers,
+        "data_type_mismatch": _py_data_type_mismatch,
+        "pattern_violation": _py_pattern_violation,
+        "quality_issue": _py_quality_issue,
+    },
+    "sql": {
+        "duplicates": _sql_duplicates,
+        "missing_data": _sql_missing_data,
+        "outliers": _sql_outliers,
+    },
+    "r": {
+        "missing_data": _r_missing_data,
+        "duplicates": _r_duplicates,
+        "outliers": _r_outliers,
+    },
+}
+
+_NO_TAGS: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=2048)
+def _render(
+    language: str,
+    insight_type: str,
+    cols: tuple[str, ...],
+    tags: frozenset[str],
+) -> str | None:
+    """Render a snippet for one insight fingerprint, memoized.
+
+    Output is deterministic in these arguments, so recurring insight
+    fingerprints become a single dict lookup instead of re-running
+    dispatch and template formatting.
+
+    Args:
+        language: Target language key
+        insight_type: Insight type
+        cols: Affected columns
+        tags: Quality tags extracted from the description
+
+    Returns:
+        Code snippet or None
+    """
+    handler = _HANDLERS[language].get(insight_type)
+    return handler(cols, tags) if handler else None
+
+
+class CodeGenerator:
+    """Generate code snippets for recommendations."""
+
+    async def generate(
+        self,
+        insight: Any,
+        language: str = "python",
+    ) -> str | None:
+        """Generate code snippet for insight.
+
+        Args:
+            insight: Insight with recommendation
+            language: Target language (python, sql, r)
+
+        Returns:
+            Code snippet or None
+        """
+        logger.info(f"Generating {language} code for insight type: {insight.type}")
+
+        if language == "python":
+            return self._generate_python(insight)
+        elif language == "sql":
+            return self._generate_sql(insight)
+        elif language == "r":
+            return self._generate_r(insight)
+        else:
+            logger.warning(f"Unsupported language: {language}")
+            return None
+
+    async def generate_batch(
+        self,
+        insights: list[Any],
+        language: str = "python",
+    ) -> dict[int, str | None]:
+        """Generate code snippets for a batch of insights in one call.
+
+        Callers with several actionable insights should prefer this over
+        awaiting generate() per insight: the whole batch is produced in a
+        single coroutine hop. Generation here is template-based, so
+        batching amortizes the async call overhead rather than an LLM
+        round-trip.
+
+        Args:
+            insights: Insights with recommendations
+            language: Target language (python, sql, r)
+
+        Returns:
+            Mapping of insight index to code snippet (or None)
+        """
+        logger.info(f"Generating {language} code for {len(insights)} insights")
+
+        if language == "python":
+            generate_one = self._generate_python
+        elif language == "sql":
+            generate_one = self._generate_sql
+        elif language == "r":
+            generate_one = self._generate_r
+        else:
+            logger.warning(f"Unsupported language: {language}")
+            return {idx: None for idx in range(len(insights))}
+
+        return {idx: generate_one(insight) for idx, insight in enumerate(insights)}
+
+    def _generate_python(self, insight: Any) -> str | None:
+        """Generate Python code snippet.
+
+        Args:
+            insight: Insight object
+
+        Returns:
+            Python code snippet
+        """
+        return _render("python", *self._fingerprint(insight))
+
+    def _generate_sql(self, insight: Any) -> str | None:
+        """Generate SQL code snippet.
+
+        Args:
+            insight: Insight object
+
+        Returns:
+            SQL code snippet
+        """
+        return _render("sql", *self._fingerprint(insight))
+
+    def _generate_r(self, insight: Any) -> str | None:
+        """Generate R code snippet.
+
+        Args:
+            insight: Insight object
+
+        Returns:
+            R code snippet
+        """
+        return _render("r", *self._fingerprint(insight))
+
+    @staticmethod
+    def _fingerprint(insight: Any) -> tuple[str, tuple[str, ...], frozenset[str]]:
+        """Marshal an insight into the hashable args _render caches on.
+
+        Args:
+            insight: Insight object
+
+        Returns:
+            (type, affected columns, quality tags) tuple
+        """
+        insight_type = insight.type
+        if insight_type == "quality_issue":
+            # Prefer tags precomputed upstream; otherwise extract
+            # (memoized) from the description
+            tags = (
+                getattr(insight, "tags", None)
+                or _extract_tags(insight.description)
+            )
+        else:
+            tags = _NO_TAGS
+        return insight_type, tuple(insight.affected_columns), tags
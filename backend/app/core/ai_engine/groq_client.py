@@ -24,10 +24,15 @@ EXAMPLE USAGE:
     print(f"Cost: ${stats['estimated_cost_usd']}")
 """
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Any
 
-from groq import AsyncGroq
+import httpx
+from groq import APIConnectionError, APITimeoutError, AsyncGroq, RateLimitError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -35,10 +40,54 @@ from tenacity import (
     wait_exponential,
 )
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Exact-match response cache: identical prompts with identical model
+# parameters skip the API round-trip (and its token cost) entirely
+_RESPONSE_CACHE: OrderedDict[str, str] = OrderedDict()
+_RESPONSE_CACHE_MAX = 1024
+
+# Estimated token counts for static prompt prefixes, keyed by sha1 of
+# the text. The system prefix is byte-stable across calls, so its
+# estimate is computed once per process instead of per request.
+_PREFIX_TOK_CACHE: dict[str, int] = {}
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate token count for text without a tokenizer dependency.
+
+    Uses the ~4 characters/token heuristic, which is close enough for
+    cost tracking when the API does not report usage.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4
+
+
+def _prefix_tokens(prefix: str) -> int:
+    """Estimated token count for a static prefix, cached by content hash.
+
+    Args:
+        prefix: Static prompt prefix text
+
+    Returns:
+        Estimated token count
+    """
+    key = hashlib.sha1(prefix.encode()).hexdigest()
+    tokens = _PREFIX_TOK_CACHE.get(key)
+    if tokens is None:
+        tokens = _estimate_tokens(prefix)
+        _PREFIX_TOK_CACHE[key] = tokens
+    return tokens
+
 
 class TokenUsageTracker:
     """Track Groq API token usage for cost monitoring."""
@@ -57,9 +106,28 @@ class TokenUsageTracker:
         """
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
-        logger.info(
-            f"Token usage - Input: {input_tokens}, Output: {output_tokens}, "
-            f"Total: {self.total_input_tokens + self.total_output_tokens}"
+        # Skip the string build entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Token usage - Input: %d, Output: %d, Total: %d",
+                input_tokens,
+                output_tokens,
+                self.total_input_tokens + self.total_output_tokens,
+            )
+
+    def add_from_text(self, prompt: str, response: str) -> None:
+        """Track usage estimated from raw text.
+
+        Client-side fallback for calls where the API omits a usage
+        block (e.g. mid-stream), so cost tracking never goes blind.
+
+        Args:
+            prompt: Prompt text sent to the API
+            response: Response text received
+        """
+        self.add(
+            input_tokens=_estimate_tokens(prompt),
+            output_tokens=_estimate_tokens(response),
         )
 
     def get_cost(self) -> float:
@@ -93,9 +161,18 @@ class GroqAPIException(Exception):
     pass
 
 
+class GroqRetryableError(GroqAPIException):
+    """Transient Groq API failure worth retrying (rate limit, timeout)."""
+
+    pass
+
+
 class GroqClient:
     """Groq API client with retry and error handling."""
 
+    # Default fan-out cap for generate_many
+    _MAX_CONCURRENCY = 20
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -116,7 +193,19 @@ class GroqClient:
         self.max_tokens = max_tokens or settings.GROQ_MAX_TOKENS
         self.temperature = temperature or settings.GROQ_TEMPERATURE
 
-        self.client = AsyncGroq(api_key=self.api_key)
+        # Shared HTTP client with a pool sized for generate_many's
+        # fan-out, so concurrent calls reuse keep-alive connections
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self._MAX_CONCURRENCY * 2,
+                max_keepalive_connections=self._MAX_CONCURRENCY,
+            ),
+            timeout=httpx.Timeout(60.0),
+        )
+        self.client = AsyncGroq(
+            api_key=self.api_key,
+            http_client=self._http_client,
+        )
         self.token_usage = TokenUsageTracker()
 
         logger.info(f"Initialized GroqClient with model: {self.model}")
@@ -124,16 +213,19 @@ class GroqClient:
     @retry(
         stop=stop_after_attempt(3),  # Try up to 3 times
         wait=wait_exponential(multiplier=1, min=2, max=10),  # Wait 2s, 4s, 8s between retries
-        retry=retry_if_exception_type(
-            # Only retry on these specific errors
-            (Exception,)  # Groq uses generic exceptions, we'll catch and check
-        ),
+        # Only transient failures retry; auth/validation errors raised as
+        # plain GroqAPIException surface immediately instead of burning
+        # 2+4+8s of backoff first
+        retry=retry_if_exception_type(GroqRetryableError),
+        reraise=True,
     )
     async def generate(
         self,
         prompt: str,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        bypass_cache: bool = False,
+        system: str | None = None,
     ) -> str:
         """Generate response from Groq API with automatic retry logic.
         
@@ -160,6 +252,10 @@ class GroqClient:
             max_tokens: Maximum tokens in response (overrides default of 2000)
             temperature: Sampling temperature 0-1 (overrides default of 0.7)
                         Lower = more focused, Higher = more creative
+            bypass_cache: Skip the exact-match response cache
+            system: Optional static system prefix, sent as a system
+                message ahead of the prompt. Keeping it byte-stable
+                across calls lets the provider reuse its cached prefix.
 
         Returns:
             Generated text response from Groq
@@ -167,13 +263,31 @@ class GroqClient:
         Raises:
             GroqAPIException: If API call fails after all retries
         """
+        cache_key = hashlib.sha256(
+            f"{self.model}|{temperature or self.temperature}|"
+            f"{max_tokens or self.max_tokens}|{system or ''}|{prompt}".encode()
+        ).hexdigest()
+
+        if not bypass_cache:
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(cache_key)
+                logger.info("Groq response cache hit - skipping API call")
+                return cached
+
         try:
             logger.info(f"Calling Groq API with prompt length: {len(prompt)} characters")
 
+            # Static instructions go first as a system message so the
+            # provider's prompt-prefix cache can reuse them
+            messages = [{"role": "user", "content": prompt}]
+            if system:
+                messages.insert(0, {"role": "system", "content": system})
+
             # Call Groq API using Groq SDK
             response = await self.client.chat.completions.create(
                 model=self.model,  # llama-3.1-70b-versatile
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 max_tokens=max_tokens or self.max_tokens,  # Default: 2000
                 temperature=temperature or self.temperature,  # Default: 0.7
             )
@@ -193,18 +307,134 @@ class GroqClient:
                 f"Groq API response received: {len(text_response)} characters"
             )
 
+            if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.popitem(last=False)
+            _RESPONSE_CACHE[cache_key] = text_response
+
             return text_response
 
+        except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+            # Transient - retried by the @retry decorator
+            logger.warning(f"Groq API error (will retry): {str(e)}")
+            raise GroqRetryableError(f"Retryable error: {str(e)}")
+
+        except Exception as e:
+            # Other errors - fail immediately
+            logger.error(f"Groq API error: {str(e)}")
+            raise GroqAPIException(f"API call failed: {str(e)}")
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        system: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a Groq response as text chunks.
+
+        Lets line-oriented consumers (ResponseParser.parse_stream) begin
+        work while the model is still decoding, instead of waiting for
+        the final token. Usage is tracked from the closing chunk when
+        the API reports it; otherwise it is estimated, reusing the
+        cached count for the static system prefix.
+
+        Args:
+            prompt: Input prompt (will be sent to Groq)
+            max_tokens: Maximum tokens in response (overrides default)
+            temperature: Sampling temperature 0-1 (overrides default)
+            system: Optional static system prefix
+
+        Yields:
+            Text chunks as they arrive from the API
+
+        Raises:
+            GroqAPIException: If the API call fails
+        """
+        logger.info(f"Streaming Groq response for prompt length: {len(prompt)}")
+
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            if system:
+                messages.insert(0, {"role": "system", "content": system})
+
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temperature or self.temperature,
+                stream=True,
+            )
+
+            usage_reported = False
+            output_chars = 0
+
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        output_chars += len(delta)
+                        yield delta
+
+                # Groq reports usage on the closing chunk
+                usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+                if usage:
+                    usage_reported = True
+                    self.token_usage.add(
+                        input_tokens=usage.prompt_tokens,
+                        output_tokens=usage.completion_tokens,
+                    )
+
+            if not usage_reported:
+                # Fall back to an estimate; the static prefix count is
+                # cached so only the dynamic prompt is re-measured
+                self.token_usage.add(
+                    input_tokens=(
+                        (_prefix_tokens(system) if system else 0)
+                        + _estimate_tokens(prompt)
+                    ),
+                    output_tokens=output_chars // 4,
+                )
+
         except Exception as e:
-            # Check if it's a rate limit or timeout error
-            error_str = str(e).lower()
-            if "rate limit" in error_str or "timeout" in error_str:
-                logger.warning(f"Groq API error (will retry): {str(e)}")
-                raise GroqAPIException(f"Retryable error: {str(e)}")
-            else:
-                # Other errors - fail immediately
-                logger.error(f"Groq API error: {str(e)}")
-                raise GroqAPIException(f"API call failed: {str(e)}")
+            logger.error(f"Groq API streaming error: {str(e)}")
+            raise GroqAPIException(f"Streaming call failed: {str(e)}")
+
+    async def generate_many(
+        self,
+        prompts: list[str],
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[str]:
+        """Generate responses for several prompts concurrently.
+
+        Network round-trips overlap instead of serializing, so wall time
+        approaches that of the slowest single call. Concurrency is
+        capped by a semaphore to stay under account rate limits.
+
+        Args:
+            prompts: Input prompts
+            max_tokens: Maximum tokens per response (overrides default)
+            temperature: Sampling temperature (overrides default)
+            max_concurrency: Maximum in-flight API calls
+
+        Returns:
+            Responses in the same order as the prompts
+
+        Raises:
+            GroqAPIException: If any API call fails after retries
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt, max_tokens, temperature)
+
+        logger.info(
+            f"Generating {len(prompts)} responses "
+            f"(max concurrency: {max_concurrency})"
+        )
+        return list(await asyncio.gather(*(bounded(p) for p in prompts)))
 
     def get_token_stats(self) -> dict[str, Any]:
         """Get token usage statistics.
@@ -212,4 +442,26 @@ class GroqClient:
         Returns:
             Dictionary with token counts and cost
         """
-        return self.token_usage.get_stats()
\ No newline at end of file
+        return self.token_usage.get_stats()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self._http_client.aclose()
+
+
+# Process-wide client. Constructing GroqClient per request would open a
+# fresh TCP+TLS pool each time; the singleton keeps connections warm
+# across requests.
+_groq_singleton: GroqClient | None = None
+
+
+def get_groq_client() -> GroqClient:
+    """Get the shared GroqClient instance, creating it on first use.
+
+    Returns:
+        Process-wide GroqClient
+    """
+    global _groq_singleton
+    if _groq_singleton is None:
+        _groq_singleton = GroqClient()
+    return _groq_singleton
\ No newline at end of file
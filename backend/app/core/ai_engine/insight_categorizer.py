@@ -1,28 +1,60 @@
 """Insight categorizer for prioritization and classification."""
 
 import logging
-from dataclasses import dataclass
+from collections import Counter
+from operator import attrgetter
 from typing import Any
 
-logger = logging.getLogger(__name__)
+try:
+    import ahocorasick
+except ImportError:
+    # Optional: without it _extract_columns falls back to per-column
+    # substring scans
+    ahocorasick = None
 
+from app.core.ai_engine.models import CategorizedInsight
 
-@dataclass
-class CategorizedInsight:
-    """Categorized insight with priority and metadata."""
+logger = logging.getLogger(__name__)
 
-    severity: str
-    type: str
-    description: str
-    recommendation: str
-    priority: int
-    affected_columns: list[str]
-    impact: str
+# Keyword -> type table, scanned in insertion order so the first match
+# wins — same precedence as the old if/elif chain, but one pass over a
+# flat dict instead of rebuilding keyword lists per call
+_KEYWORD_TO_TYPE = {
+    "missing": "missing_data",
+    "null": "missing_data",
+    "empty": "missing_data",
+    "blank": "missing_data",
+    "duplicate": "duplicates",
+    "repeated": "duplicates",
+    "outlier": "outliers",
+    "anomal": "outliers",
+    "type": "data_type_mismatch",
+    "mismatch": "data_type_mismatch",
+    "inconsistent type": "data_type_mismatch",
+    "pattern": "pattern_violation",
+    "format": "pattern_violation",
+    "structure": "pattern_violation",
+    "correlation": "quality_issue",
+    "multicollinearity": "quality_issue",
+    "related": "quality_issue",
+    "cardinality": "quality_issue",
+    "unique": "quality_issue",
+    "distinct": "quality_issue",
+}
 
 
 class InsightCategorizer:
     """Categorize and prioritize insights."""
 
+    # Bound on the memoized categorization results
+    _CACHE_MAX = 256
+
+    def __init__(self) -> None:
+        """Initialize insight categorizer."""
+        # Entries pair the profile object with an immutable result
+        # snapshot, mirroring the identity guard in cache_manager
+        self._cache: dict[tuple, tuple[Any, tuple[CategorizedInsight, ...]]] = {}
+
     async def categorize(
         self,
         raw_insights: list[Any],
@@ -39,10 +71,31 @@ class InsightCategorizer:
         Returns:
             Categorized and prioritized insights
         """
+        # Categorization is deterministic in these inputs; identical
+        # responses against the same profile skip the whole loop. The
+        # entry keeps a reference to the profile and is only served when
+        # it is the very same object (recycled ids can't alias another
+        # profile); the revision attribute, when exposed, catches
+        # in-place mutation.
+        cache_key = (
+            tuple((r.severity, r.description, r.recommendation) for r in raw_insights),
+            getattr(profile_result, "revision", None),
+            goal_type,
+        )
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[0] is profile_result:
+            logger.info(f"Categorization cache hit for goal '{goal_type}'")
+            # Fresh list: callers reorder and swap entries afterwards
+            return list(entry[1])
+
         categorized = []
 
         logger.info(f"Categorizing {len(raw_insights)} insights for goal '{goal_type}'")
 
+        # One automaton over all column names turns each description
+        # scan into O(len(description)) instead of O(columns x length)
+        automaton = self._build_automaton(profile_result)
+
         for raw in raw_insights:
             # Detect insight type from description
             insight_type = self._detect_type(raw.description)
@@ -54,7 +107,9 @@ class InsightCategorizer:
             impact = self._determine_impact(raw.severity, insight_type)
 
             # Extract affected columns
-            affected_columns = self._extract_columns(raw.description, profile_result)
+            affected_columns = self._extract_columns(
+                raw.description, profile_result, automaton
+            )
 
             categorized.append(
                 CategorizedInsight(
@@ -69,14 +124,21 @@ class InsightCategorizer:
             )
 
         # Sort by priority (lower number = higher priority)
-        categorized.sort(key=lambda x: (x.priority, x.severity))
+        categorized.sort(key=attrgetter("priority", "severity"))
 
+        # One pass over the list instead of a scan per severity
+        counts = Counter(i.severity for i in categorized)
         logger.info(
-            f"Categorized insights: {sum(1 for i in categorized if i.severity == 'critical')} critical, "
-            f"{sum(1 for i in categorized if i.severity == 'warning')} warnings, "
-            f"{sum(1 for i in categorized if i.severity == 'info')} info"
+            f"Categorized insights: {counts['critical']} critical, "
+            f"{counts['warning']} warnings, {counts['info']} info"
         )
 
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.pop(next(iter(self._cache)))
+        # Store an immutable snapshot - the returned list is the
+        # caller's to reorder and grow without polluting the cache
+        self._cache[cache_key] = (profile_result, tuple(categorized))
+
         return categorized
 
     def _detect_type(self, description: str) -> str:
@@ -90,46 +152,11 @@ class InsightCategorizer:
         """
         description_lower = description.lower()
 
-        # Check for specific patterns
-        if any(
-            keyword in description_lower
-            for keyword in ["missing", "null", "empty", "blank"]
-        ):
-            return "missing_data"
-
-        elif any(
-            keyword in description_lower for keyword in ["duplicate", "repeated"]
-        ):
-            return "duplicates"
-
-        elif any(keyword in description_lower for keyword in ["outlier", "anomal"]):
-            return "outliers"
-
-        elif any(
-            keyword in description_lower
-            for keyword in ["type", "mismatch", "inconsistent type"]
-        ):
-            return "data_type_mismatch"
-
-        elif any(
-            keyword in description_lower for keyword in ["pattern", "format", "structure"]
-        ):
-            return "pattern_violation"
-
-        elif any(
-            keyword in description_lower
-            for keyword in ["correlation", "multicollinearity", "related"]
-        ):
-            return "quality_issue"
-
-        elif any(
-            keyword in description_lower
-            for keyword in ["cardinality", "unique", "distinct"]
-        ):
-            return "quality_issue"
+        for keyword, insight_type in _KEYWORD_TO_TYPE.items():
+            if keyword in description_lower:
+                return insight_type
 
-        else:
-            return "quality_issue"
+        return "quality_issue"
 
     def _calculate_priority(
         self,
@@ -195,20 +222,57 @@ class InsightCategorizer:
         else:
             return "Low"
 
+    def _build_automaton(self, profile_result: Any) -> Any:
+        """Build an Aho-Corasick automaton over all column names.
+
+        Args:
+            profile_result: Profiling results
+
+        Returns:
+            Automaton, or None when pyahocorasick is unavailable
+        """
+        if ahocorasick is None:
+            return None
+
+        # The needles are the same delimited variants the fallback path
+        # checks, so both paths match (and miss) identically
+        automaton = ahocorasick.Automaton()
+        for profile in profile_result.column_profiles:
+            name = profile.column_name
+            for needle in (f"'{name}'", f'"{name}"', f" {name} "):
+                automaton.add_word(needle, name)
+        automaton.make_automaton()
+        return automaton
+
     def _extract_columns(
         self,
         description: str,
         profile_result: Any,
+        automaton: Any = None,
     ) -> list[str]:
         """Extract mentioned column names from description.
 
         Args:
             description: Insight description
             profile_result: Profiling results
+            automaton: Optional pre-built column-name automaton
 
         Returns:
             List of affected column names
         """
+        # Pad once so the bare-word needles can match at either edge of
+        # the description
+        padded = f" {description} "
+
+        if automaton is not None:
+            found = {col_name for _, col_name in automaton.iter(padded)}
+            # Profile order, same as the fallback below
+            return [
+                profile.column_name
+                for profile in profile_result.column_profiles
+                if profile.column_name in found
+            ]
+
         columns = []
 
         # Extract column names mentioned in description
@@ -217,9 +281,10 @@ class InsightCategorizer:
 
             # Check if column name appears in description
             # Use word boundaries to avoid partial matches
-            if f"'{col_name}'" in description or f'"{col_name}"' in description:
-                columns.append(col_name)
-            elif f" {col_name} " in f" {description} ":
+            if any(
+                needle in padded
+                for needle in (f"'{col_name}'", f'"{col_name}"', f" {col_name} ")
+            ):
                 columns.append(col_name)
 
         return columns
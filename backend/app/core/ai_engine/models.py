@@ -1,10 +1,10 @@
 """Data models for AI engine."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RawInsight:
     """Parsed insight from Claude response."""
 
@@ -13,9 +13,15 @@ class RawInsight:
     recommendation: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CategorizedInsight:
-    """Categorized insight with priority and metadata."""
+    """Categorized insight with priority and metadata.
+
+    Instances are created in large batches (one per insight, plus cache
+    rehydration), so slots are used to avoid a per-instance __dict__ and
+    speed up attribute access in the hot construction paths. Frozen
+    keeps them hashable; updates go through dataclasses.replace.
+    """
 
     severity: str
     type: str
@@ -29,10 +35,22 @@ class CategorizedInsight:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary.
 
+        Built field-by-field rather than with dataclasses.asdict, whose
+        recursive deep copy is pure overhead for this flat shape.
+
         Returns:
             Dictionary representation
         """
-        return asdict(self)
+        return {
+            "severity": self.severity,
+            "type": self.type,
+            "description": self.description,
+            "recommendation": self.recommendation,
+            "priority": self.priority,
+            "affected_columns": list(self.affected_columns),
+            "impact": self.impact,
+            "code_suggestion": self.code_suggestion,
+        }
 
 
 class TokenUsageTracker:
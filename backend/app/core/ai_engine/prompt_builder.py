@@ -1,17 +1,56 @@
 """Prompt builder for context-aware Claude API prompts."""
 
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+import numpy as np
 
 from app.core.ai_engine.anonymizer import DataAnonymizer
 
 logger = logging.getLogger(__name__)
 
 
+def _split_template(template: str) -> tuple[str, str]:
+    """Split a template into static text and its dynamic data block.
+
+    The data block spans from the first to the last line containing a
+    placeholder; everything around it (intro and instructions) is
+    static. The static part is byte-stable per template, which is what
+    provider-side prompt-prefix caching keys on.
+
+    Args:
+        template: Raw template text
+
+    Returns:
+        (static text, dynamic block template) pair
+    """
+    lines = template.splitlines()
+    placeholder_lines = [i for i, line in enumerate(lines) if "{" in line]
+    if not placeholder_lines:
+        return template, ""
+
+    start, end = placeholder_lines[0], placeholder_lines[-1]
+    static = "\n".join(lines[:start] + lines[end + 1 :])
+    dynamic = "\n".join(lines[start : end + 1])
+    return static, dynamic
+
+
 class PromptBuilder:
     """Build context-aware prompts for Claude API."""
 
+    # Template files, loaded lazily on first use and cached at class
+    # level so every PromptBuilder in the process shares one copy
+    _TEMPLATE_FILES: ClassVar[dict[str, str]] = {
+        "ml": "ml_prompt.txt",
+        "business": "business_prompt.txt",
+        "anomaly": "anomaly_prompt.txt",
+        "general": "general_prompt.txt",
+    }
+    _TEMPLATES: ClassVar[dict[str, str]] = {}
+    _TEMPLATE_PARTS: ClassVar[dict[str, tuple[str, str]]] = {}
+
     def __init__(self, anonymizer: DataAnonymizer | None = None):
         """Initialize prompt builder.
 
@@ -19,8 +58,7 @@ class PromptBuilder:
             anonymizer: Data anonymizer instance
         """
         self.anonymizer = anonymizer or DataAnonymizer()
-        self.templates = self._load_templates()
-        logger.info("PromptBuilder initialized with templates")
+        logger.info("PromptBuilder initialized")
 
     async def build(
         self,
@@ -38,7 +76,7 @@ class PromptBuilder:
         """
         # Select appropriate template
         template_key = self._get_template_key(goal_type)
-        template = self.templates.get(template_key, self.templates["general"])
+        template = self._get_template(template_key)
 
         # Prepare dataset summary
         dataset_summary = self._create_dataset_summary(profile_result)
@@ -48,7 +86,7 @@ class PromptBuilder:
 
         # Anonymize sample data (first 5 columns)
         sample_columns = profile_result.column_profiles[:5]
-        sample_data = await self.anonymizer.anonymize(sample_columns)
+        sample_data = self.anonymizer.anonymize(sample_columns)
 
         # Format prompt
         prompt = template.format(
@@ -63,6 +101,45 @@ class PromptBuilder:
 
         return prompt
 
+    async def build_parts(
+        self,
+        profile_result: Any,
+        goal_type: str,
+    ) -> tuple[str, str]:
+        """Build a (static system prefix, dynamic user content) pair.
+
+        The system prefix is the template's instruction text and is
+        byte-identical across datasets sharing a goal template, so the
+        provider can reuse its cached prompt prefix; everything
+        per-dataset goes in the user content.
+
+        Args:
+            profile_result: Complete profiling results
+            goal_type: User's analysis goal
+
+        Returns:
+            (system prefix, user content) pair
+        """
+        template_key = self._get_template_key(goal_type)
+        static, dynamic = self._get_template_parts(template_key)
+
+        user_content = dynamic.format(
+            dataset_summary=self._create_dataset_summary(profile_result),
+            issues_summary=self._create_issues_summary(profile_result),
+            sample_data=self.anonymizer.anonymize(
+                profile_result.column_profiles[:5]
+            ),
+            quality_score=profile_result.quality_score,
+            goal=goal_type,
+        )
+
+        logger.info(
+            f"Built split prompt for goal '{goal_type}' "
+            f"(system: {len(static)}, user: {len(user_content)} chars)"
+        )
+
+        return static, user_content
+
     def _get_template_key(self, goal_type: str) -> str:
         """Map goal type to template key.
 
@@ -115,13 +192,20 @@ class PromptBuilder:
             Formatted issues summary
         """
         issues = []
+        profiles = profile_result.column_profiles
+        count = len(profiles)
+
+        # Per-column thresholds as vectorized masks over contiguous
+        # arrays instead of Python-level loops
+        names = np.array([p.column_name for p in profiles], dtype=object)
+        null_pcts = np.fromiter(
+            (p.null_percentage for p in profiles),
+            dtype=np.float64,
+            count=count,
+        )
 
         # High null percentage
-        high_null_cols = [
-            p.column_name
-            for p in profile_result.column_profiles
-            if p.null_percentage > 30
-        ]
+        high_null_cols = names[null_pcts > 30].tolist()
         if high_null_cols:
             issues.append(
                 f"- High null percentage (>30%) in: {', '.join(high_null_cols[:5])}"
@@ -136,12 +220,17 @@ class PromptBuilder:
                 issues.append(f"- {dup_pct:.1f}% duplicate rows detected")
 
         # Outliers
-        outlier_cols = []
-        for p in profile_result.column_profiles:
-            if hasattr(p, "outliers") and p.outliers:
-                outlier_pct = p.outliers.get("percentage", 0)
-                if outlier_pct > 10:
-                    outlier_cols.append(p.column_name)
+        outlier_pcts = np.fromiter(
+            (
+                p.outliers.get("percentage", 0)
+                if getattr(p, "outliers", None)
+                else 0.0
+                for p in profiles
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        outlier_cols = names[outlier_pcts > 10].tolist()
 
         if outlier_cols:
             issues.append(
@@ -154,15 +243,20 @@ class PromptBuilder:
         if hasattr(profile_result, "quality_metrics"):
             corr_matrix = profile_result.quality_metrics.correlation_matrix
             if corr_matrix:
-                high_corr_pairs = []
-                for col1, correlations in corr_matrix.items():
-                    for col2, corr_value in correlations.items():
-                        if abs(corr_value) > 0.9:
-                            high_corr_pairs.append(f"{col1} & {col2}")
-                            if len(high_corr_pairs) >= 3:
-                                break
-                    if len(high_corr_pairs) >= 3:
-                        break
+                # One dense matrix, then a single C-level comparison;
+                # the upper triangle skips self- and mirror pairs
+                corr_cols = list(corr_matrix)
+                matrix = np.array(
+                    [
+                        [abs(corr_matrix[a].get(b, 0.0)) for b in corr_cols]
+                        for a in corr_cols
+                    ],
+                    dtype=np.float64,
+                )
+                pair_idx = np.argwhere(np.triu(matrix > 0.9, k=1))[:3]
+                high_corr_pairs = [
+                    f"{corr_cols[i]} & {corr_cols[j]}" for i, j in pair_idx
+                ]
 
                 if high_corr_pairs:
                     issues.append(
@@ -180,47 +274,67 @@ class PromptBuilder:
         Returns:
             Formatted column type breakdown
         """
-        type_counts: dict[str, int] = {}
-        for profile in column_profiles:
-            dtype = profile.data_type
-            type_counts[dtype] = type_counts.get(dtype, 0) + 1
+        # Counter tallies in C instead of a get()+store per profile
+        type_counts = Counter(p.data_type for p in column_profiles)
 
-        lines = []
-        for dtype, count in sorted(type_counts.items()):
-            lines.append(f"- {dtype}: {count} column(s)")
+        return "\n".join(
+            f"- {dtype}: {count} column(s)"
+            for dtype, count in sorted(type_counts.items())
+        )
 
-        return "\n".join(lines)
+    @classmethod
+    def _get_template(cls, key: str) -> str:
+        """Get a template by key, loading its file on first access.
 
-    def _load_templates(self) -> dict[str, str]:
-        """Load prompt templates from files.
+        Unknown keys resolve to the general template.
+
+        Args:
+            key: Template key
 
         Returns:
-            Dictionary of template name to template content
+            Template content
         """
-        templates = {}
-        template_dir = Path(__file__).parent / "templates"
-
-        template_files = {
-            "ml": "ml_prompt.txt",
-            "business": "business_prompt.txt",
-            "anomaly": "anomaly_prompt.txt",
-            "general": "general_prompt.txt",
-        }
+        if key not in cls._TEMPLATE_FILES:
+            key = "general"
 
-        for key, filename in template_files.items():
-            template_path = template_dir / filename
+        template = cls._TEMPLATES.get(key)
+        if template is None:
+            template_path = (
+                Path(__file__).parent / "templates" / cls._TEMPLATE_FILES[key]
+            )
             try:
                 with open(template_path, "r", encoding="utf-8") as f:
-                    templates[key] = f.read()
+                    template = f.read()
                 logger.debug(f"Loaded template: {key}")
             except FileNotFoundError:
                 logger.warning(f"Template file not found: {template_path}")
                 # Fallback to basic template
-                templates[key] = self._get_fallback_template()
+                template = cls._get_fallback_template()
+            cls._TEMPLATES[key] = template
+
+        return template
+
+    @classmethod
+    def _get_template_parts(cls, key: str) -> tuple[str, str]:
+        """Get a template's (static, dynamic) split, cached per key.
+
+        Args:
+            key: Template key
+
+        Returns:
+            (static text, dynamic block template) pair
+        """
+        if key not in cls._TEMPLATE_FILES:
+            key = "general"
 
-        return templates
+        parts = cls._TEMPLATE_PARTS.get(key)
+        if parts is None:
+            parts = _split_template(cls._get_template(key))
+            cls._TEMPLATE_PARTS[key] = parts
+        return parts
 
-    def _get_fallback_template(self) -> str:
+    @classmethod
+    def _get_fallback_template(cls) -> str:
         """Get fallback template if file loading fails.
 
         Returns:
@@ -2,18 +2,94 @@
 
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from functools import lru_cache
+
+from app.core.ai_engine.models import RawInsight
 
 logger = logging.getLogger(__name__)
 
+# Precompiled line formats, matched once per line. The combined pattern
+# handles "SEVERITY: description | RECOMMENDATION: action" (the
+# RECOMMENDATION: prefix is optional) without a separate split on '|'.
+_SEV_WITH_REC = re.compile(
+    r"(CRITICAL|WARNING|INFO):\s*(.+?)\s*\|\s*(?:RECOMMENDATION:\s*)?(.+)",
+    re.IGNORECASE,
+)
+_SEV_ONLY = re.compile(r"(CRITICAL|WARNING|INFO):\s*(.+)", re.IGNORECASE)
+
+
+def _parse_line(line: str) -> RawInsight | None:
+    """Parse a single line into an insight.
+
+    Args:
+        line: Line to parse
+
+    Returns:
+        Parsed insight or None if parsing fails
+    """
+    # Format: "SEVERITY: description | RECOMMENDATION: action"
+    match = _SEV_WITH_REC.match(line)
+    if match:
+        return RawInsight(
+            severity=match.group(1).lower(),
+            description=match.group(2).strip(),
+            recommendation=match.group(3).strip(),
+        )
+
+    # Format without recommendation: "SEVERITY: description"
+    match = _SEV_ONLY.match(line)
+    if match:
+        return RawInsight(
+            severity=match.group(1).lower(),
+            description=match.group(2).strip(),
+            recommendation="",
+        )
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_response(response: str) -> tuple[RawInsight, ...]:
+    """Parse a full response into insights, memoized per response text.
+
+    Parsing is deterministic, so identical responses (cache hits,
+    retries, repeated analyses) pay the line loop only once.
+
+    Args:
+        response: Raw text response from Claude
+
+    Returns:
+        Tuple of parsed insights
+    """
+    insights = []
+    lines = response.strip().split("\n")
+
+    logger.info(f"Parsing response with {len(lines)} lines")
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+
+        # Skip empty lines
+        if not line:
+            continue
+
+        # Parse format: "SEVERITY: description | RECOMMENDATION: action"
+        if ":" in line:
+            try:
+                insight = _parse_line(line)
+                if insight:
+                    insights.append(insight)
+                    logger.debug(
+                        f"Parsed insight: {insight.severity} - {insight.description[:50]}..."
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to parse line {line_num}: {line[:100]} - {str(e)}")
+                continue
 
-@dataclass
-class RawInsight:
-    """Parsed insight from Claude response."""
+    logger.info(f"Successfully parsed {len(insights)} insights")
 
-    severity: str
-    description: str
-    recommendation: str
+    return tuple(insights)
 
 
 class ResponseParser:
@@ -28,34 +104,61 @@ class ResponseParser:
         Returns:
             List of parsed insights
         """
-        insights = []
-        lines = response.strip().split("\n")
+        return list(_parse_response(response))
 
-        logger.info(f"Parsing response with {len(lines)} lines")
+    async def parse_stream(
+        self,
+        chunks: AsyncIterator[str],
+    ) -> AsyncIterator[RawInsight]:
+        """Parse insights incrementally from streamed response text.
 
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
+        Buffers partial text and emits an insight as soon as each line
+        completes, overlapping parsing with the model's generation.
 
-            # Skip empty lines
-            if not line:
-                continue
+        Args:
+            chunks: Async iterator of response text chunks
+
+        Yields:
+            Parsed insights as their lines complete
+        """
+        buffer = ""
+        parsed = 0
+
+        async for chunk in chunks:
+            buffer += chunk
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                insight = self._parse_buffered_line(line)
+                if insight:
+                    parsed += 1
+                    yield insight
 
-            # Parse format: "SEVERITY: description | RECOMMENDATION: action"
-            if ":" in line:
-                try:
-                    insight = self._parse_line(line)
-                    if insight:
-                        insights.append(insight)
-                        logger.debug(
-                            f"Parsed insight: {insight.severity} - {insight.description[:50]}..."
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to parse line {line_num}: {line[:100]} - {str(e)}")
-                    continue
+        # Trailing text after the last newline is still a full line
+        insight = self._parse_buffered_line(buffer)
+        if insight:
+            parsed += 1
+            yield insight
 
-        logger.info(f"Successfully parsed {len(insights)} insights")
+        logger.info(f"Successfully parsed {parsed} insights from stream")
+
+    def _parse_buffered_line(self, line: str) -> RawInsight | None:
+        """Parse one buffered line, tolerating malformed input.
+
+        Args:
+            line: Complete line from the stream buffer
+
+        Returns:
+            Parsed insight or None
+        """
+        line = line.strip()
+        if not line or ":" not in line:
+            return None
 
-        return insights
+        try:
+            return _parse_line(line)
+        except Exception as e:
+            logger.warning(f"Failed to parse line: {line[:100]} - {str(e)}")
+            return None
 
     def _parse_line(self, line: str) -> RawInsight | None:
         """Parse a single line into an insight.
@@ -66,55 +169,7 @@ class ResponseParser:
         Returns:
             Parsed insight or None if parsing fails
         """
-        # Check if line contains recommendation separator
-        if "|" in line:
-            # Format: "SEVERITY: description | RECOMMENDATION: action"
-            parts = line.split("|", 1)
-            severity_part = parts[0].strip()
-            rec_part = parts[1].strip() if len(parts) > 1 else ""
-
-            # Extract severity and description
-            severity_match = re.match(
-                r"(CRITICAL|WARNING|INFO):\s*(.+)", severity_part, re.IGNORECASE
-            )
-            if not severity_match:
-                return None
-
-            severity = severity_match.group(1).lower()
-            description = severity_match.group(2).strip()
-
-            # Extract recommendation
-            recommendation = ""
-            if rec_part:
-                rec_match = re.match(r"RECOMMENDATION:\s*(.+)", rec_part, re.IGNORECASE)
-                if rec_match:
-                    recommendation = rec_match.group(1).strip()
-                else:
-                    # If no RECOMMENDATION: prefix, use the whole part
-                    recommendation = rec_part
-
-            return RawInsight(
-                severity=severity,
-                description=description,
-                recommendation=recommendation,
-            )
-
-        else:
-            # Format without recommendation: "SEVERITY: description"
-            severity_match = re.match(
-                r"(CRITICAL|WARNING|INFO):\s*(.+)", line, re.IGNORECASE
-            )
-            if severity_match:
-                severity = severity_match.group(1).lower()
-                description = severity_match.group(2).strip()
-
-                return RawInsight(
-                    severity=severity,
-                    description=description,
-                    recommendation="",
-                )
-
-        return None
+        return _parse_line(line)
 
     def validate_response(self, response: str) -> bool:
         """Validate that response has expected format.
@@ -1,21 +1,65 @@
 """Story generator for creating plain English executive summaries."""
 
 import logging
-from typing import Any
+import sys
+from bisect import bisect_right
+from collections import Counter
+from operator import attrgetter
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
 
+class ProfileSummary(Protocol):
+    """Shape of the profiling result fields the summaries read."""
+
+    row_count: int
+    column_count: int
+    quality_score: int
+
+
+_get_severity = attrgetter("severity")
+
+# Interned severity literals: str equality then short-circuits on
+# pointer identity whenever the compared value is interned too. Raw
+# `is` would be unsafe - severities arrive via .lower() and may be
+# fresh objects. The frozenset is built once instead of per call.
+_CRITICAL = sys.intern("critical")
+_WARNING = sys.intern("warning")
+_INFO = sys.intern("info")
+_IMPORTANT = frozenset((_CRITICAL, _WARNING))
+
+# Threshold bands resolved with one bisect call instead of an if/elif
+# ladder; descs[i] covers scores below thresholds[i] (last entry is the
+# open top band)
+_SIZE_THRESHOLDS = (1000, 100000, 1000000)
+_SIZE_DESCS = ("small", "medium-sized", "large", "very large")
+
+_QUALITY_THRESHOLDS = (50, 60, 70, 80, 90)
+_QUALITY_DESCS = ("poor", "below average", "fair", "good", "very good", "excellent")
+
+_STATUS_THRESHOLDS = (50, 70, 85)
+_STATUS_DESCS = (
+    "needs improvement",
+    "fair condition",
+    "good condition",
+    "excellent condition",
+)
+
+
 class StoryGenerator:
     """Generate plain English executive summaries."""
 
-    async def generate(
+    def generate(
         self,
-        profile_result: Any,
+        profile_result: ProfileSummary,
         insights: list[Any],
     ) -> str:
         """Generate executive summary.
 
+        Pure string formatting with no I/O, so it is a plain function —
+        no coroutine object or event-loop hop per summary.
+
         Args:
             profile_result: Profiling results
             insights: Generated insights
@@ -25,32 +69,56 @@ class StoryGenerator:
         """
         logger.info("Generating executive summary")
 
-        summary_parts = []
-
-        # Dataset description
-        summary_parts.append(self._create_dataset_intro(profile_result))
-
-        # Quality assessment
-        summary_parts.append(self._create_quality_assessment(profile_result))
+        # One walk over the insights; the helpers take the precomputed
+        # counts instead of re-scanning the list each
+        critical_count, warning_count, info_count, top_issue = self._tally(insights)
 
-        # Issues summary
-        summary_parts.append(self._create_issues_summary(insights))
-
-        # Top issue highlight
-        top_issue = self._get_top_issue(insights)
+        # Fixed-size slots written by index; the list never reallocates
+        summary_parts: list[str | None] = [None] * 5
+        summary_parts[0] = self._create_dataset_intro(profile_result)
+        summary_parts[1] = self._create_quality_assessment(profile_result)
+        summary_parts[2] = self._create_issues_summary(
+            critical_count, warning_count, info_count
+        )
         if top_issue:
-            summary_parts.append(self._create_top_issue_highlight(top_issue))
+            summary_parts[3] = self._create_top_issue_highlight(top_issue)
+        summary_parts[4] = self._create_conclusion(
+            profile_result, critical_count, warning_count
+        )
 
-        # Positive note or next steps
-        summary_parts.append(self._create_conclusion(profile_result, insights))
+        if top_issue is None:
+            del summary_parts[3]
 
         summary = " ".join(summary_parts)
 
-        logger.info(f"Generated summary with {len(summary)} characters")
+        logger.info("Generated summary with %d characters", len(summary))
 
         return summary
 
-    def _create_dataset_intro(self, profile_result: Any) -> str:
+    @staticmethod
+    def _tally(insights: list[Any]) -> tuple[int, int, int, Any | None]:
+        """Tally severities and find the top issue in one pass.
+
+        Args:
+            insights: List of insights (already sorted by priority)
+
+        Returns:
+            (critical count, warning count, info count, top issue)
+            where the top issue is the first critical or warning, or
+            None if there are none
+        """
+        # Counter with an attrgetter runs the counting loop in C; the
+        # top-issue scan stops at the first hit
+        counts = Counter(map(_get_severity, insights))
+        top = next(
+            (i for i in insights if i.severity in _IMPORTANT),
+            None,
+        )
+
+        return counts[_CRITICAL], counts[_WARNING], counts[_INFO], top
+
+    @staticmethod
+    def _create_dataset_intro(profile_result: ProfileSummary) -> str:
         """Create dataset introduction.
 
         Args:
@@ -62,25 +130,16 @@ class StoryGenerator:
         row_count = profile_result.row_count
         col_count = profile_result.column_count
 
-        # Format row count with commas
-        row_str = f"{row_count:,}"
-
         # Determine dataset size description
-        if row_count < 1000:
-            size_desc = "small"
-        elif row_count < 100000:
-            size_desc = "medium-sized"
-        elif row_count < 1000000:
-            size_desc = "large"
-        else:
-            size_desc = "very large"
+        size_desc = _SIZE_DESCS[bisect_right(_SIZE_THRESHOLDS, row_count)]
 
         return (
-            f"This is a {size_desc} dataset containing {row_str} rows "
+            f"This is a {size_desc} dataset containing {row_count:,} rows "
             f"and {col_count} columns."
         )
 
-    def _create_quality_assessment(self, profile_result: Any) -> str:
+    @staticmethod
+    def _create_quality_assessment(profile_result: ProfileSummary) -> str:
         """Create quality assessment.
 
         Args:
@@ -92,41 +151,26 @@ class StoryGenerator:
         quality_score = profile_result.quality_score
 
         # Determine quality description
-        if quality_score >= 90:
-            quality_desc = "excellent"
-            emoji = "✨"
-        elif quality_score >= 80:
-            quality_desc = "very good"
-            emoji = "👍"
-        elif quality_score >= 70:
-            quality_desc = "good"
-            emoji = "✓"
-        elif quality_score >= 60:
-            quality_desc = "fair"
-            emoji = "⚠️"
-        elif quality_score >= 50:
-            quality_desc = "below average"
-            emoji = "⚠️"
-        else:
-            quality_desc = "poor"
-            emoji = "❌"
+        quality_desc = _QUALITY_DESCS[bisect_right(_QUALITY_THRESHOLDS, quality_score)]
 
         return f"Overall data quality is {quality_desc} ({quality_score}/100)."
 
-    def _create_issues_summary(self, insights: list[Any]) -> str:
+    @staticmethod
+    def _create_issues_summary(
+        critical_count: int,
+        warning_count: int,
+        info_count: int,
+    ) -> str:
         """Create issues summary.
 
         Args:
-            insights: List of insights
+            critical_count: Number of critical insights
+            warning_count: Number of warning insights
+            info_count: Number of info insights
 
         Returns:
             Issues summary text
         """
-        # Count by severity
-        critical_count = sum(1 for i in insights if i.severity == "critical")
-        warning_count = sum(1 for i in insights if i.severity == "warning")
-        info_count = sum(1 for i in insights if i.severity == "info")
-
         parts = []
 
         if critical_count > 0:
@@ -158,7 +202,8 @@ class StoryGenerator:
 
         return " ".join(parts)
 
-    def _get_top_issue(self, insights: list[Any]) -> Any | None:
+    @staticmethod
+    def _get_top_issue(insights: list[Any]) -> Any | None:
         """Get the top priority issue.
 
         Args:
@@ -167,18 +212,16 @@ class StoryGenerator:
         Returns:
             Top issue or None
         """
-        # Filter to critical and warnings only
-        important_insights = [
-            i for i in insights if i.severity in {"critical", "warning"}
-        ]
-
-        if not important_insights:
-            return None
+        # Return the first critical or warning (already sorted by
+        # priority) without materializing a filtered list
+        for insight in insights:
+            if insight.severity in _IMPORTANT:
+                return insight
 
-        # Return the first one (already sorted by priority)
-        return important_insights[0]
+        return None
 
-    def _create_top_issue_highlight(self, issue: Any) -> str:
+    @staticmethod
+    def _create_top_issue_highlight(issue: Any) -> str:
         """Create highlight for top issue.
 
         Args:
@@ -187,28 +230,33 @@ class StoryGenerator:
         Returns:
             Highlight text
         """
-        severity_text = "most critical issue" if issue.severity == "critical" else "main concern"
-
-        # Truncate description if too long
+        severity_text = "most critical issue" if issue.severity == _CRITICAL else "main concern"
         description = issue.description
-        if len(description) > 150:
-            description = description[:147] + "..."
 
-        return f"The {severity_text} is: {description}"
+        # One f-string render per branch, no intermediate truncated copy
+        return (
+            f"The {severity_text} is: {description[:147]}..."
+            if len(description) > 150
+            else f"The {severity_text} is: {description}"
+        )
 
-    def _create_conclusion(self, profile_result: Any, insights: list[Any]) -> str:
+    @staticmethod
+    def _create_conclusion(
+        profile_result: ProfileSummary,
+        critical_count: int,
+        warning_count: int,
+    ) -> str:
         """Create conclusion with next steps.
 
         Args:
             profile_result: Profiling results
-            insights: List of insights
+            critical_count: Number of critical insights
+            warning_count: Number of warning insights
 
         Returns:
             Conclusion text
         """
         quality_score = profile_result.quality_score
-        critical_count = sum(1 for i in insights if i.severity == "critical")
-        warning_count = sum(1 for i in insights if i.severity == "warning")
 
         if quality_score >= 85 and critical_count == 0:
             return (
@@ -234,7 +282,8 @@ class StoryGenerator:
                 "Review the insights for opportunities to enhance data quality."
             )
 
-    def generate_short_summary(self, profile_result: Any) -> str:
+    @staticmethod
+    def generate_short_summary(profile_result: ProfileSummary) -> str:
         """Generate a short one-line summary.
 
         Args:
@@ -247,14 +296,7 @@ class StoryGenerator:
         row_count = profile_result.row_count
         col_count = profile_result.column_count
 
-        if quality_score >= 85:
-            status = "excellent condition"
-        elif quality_score >= 70:
-            status = "good condition"
-        elif quality_score >= 50:
-            status = "fair condition"
-        else:
-            status = "needs improvement"
+        status = _STATUS_DESCS[bisect_right(_STATUS_THRESHOLDS, quality_score)]
 
         return (
             f"{row_count:,} rows × {col_count} columns | "
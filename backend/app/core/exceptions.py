@@ -12,6 +12,8 @@ class AppException(Exception):
         error_code: Application-specific error code
     """
 
+    __slots__ = ("status_code", "detail", "error_code")
+
     def __init__(
         self, status_code: int, detail: str, error_code: str | None = None
     ) -> None:
@@ -31,6 +33,8 @@ class AppException(Exception):
 class NotFoundException(AppException):
     """Resource not found exception."""
 
+    __slots__ = ()
+
     def __init__(self, detail: str = "Resource not found") -> None:
         """Initialize exception.
         
@@ -43,6 +47,8 @@ class NotFoundException(AppException):
 class UnauthorizedException(AppException):
     """Unauthorized access exception."""
 
+    __slots__ = ()
+
     def __init__(self, detail: str = "Unauthorized") -> None:
         """Initialize exception.
         
@@ -55,6 +61,8 @@ class UnauthorizedException(AppException):
 class ValidationException(AppException):
     """Validation error exception."""
 
+    __slots__ = ()
+
     def __init__(self, detail: str = "Validation error") -> None:
         """Initialize exception.
         
@@ -67,6 +75,8 @@ class ValidationException(AppException):
 class AIServiceException(AppException):
     """AI service operation failed."""
 
+    __slots__ = ()
+
     def __init__(self, detail: str = "AI service error") -> None:
         """Initialize exception.
         
@@ -79,6 +89,8 @@ class AIServiceException(AppException):
 class ClaudeAPIException(AppException):
     """Claude API call failed."""
 
+    __slots__ = ()
+
     def __init__(self, detail: str = "Claude API error") -> None:
         """Initialize exception.
         
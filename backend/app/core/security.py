@@ -1,14 +1,38 @@
 """Security utilities for authentication and authorization."""
 
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
 from typing import Any
 
+import bcrypt
 from jose import jwt
-from passlib.context import CryptContext
 
-from app.config import settings
+from app.config import get_settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_settings()
+
+# bcrypt work factor; matches the passlib default previously in use
+_BCRYPT_ROUNDS = 12
+
+# For the symmetric HS256 setup the JWT header never changes, so its
+# encoded form and the key bytes are computed once at import; per-token
+# work is then just the payload JSON plus one HMAC. Other algorithms
+# fall back to jose.
+_IS_HS256 = settings.ALGORITHM == "HS256"
+_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": settings.ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+_KEY = settings.SECRET_KEY.encode()
+
+# Memoized verification results keyed on (sha256 of the plaintext,
+# hash), so the plaintext itself is never stored. Only consulted when
+# settings.CACHE_PASSWORD_VERIFY is on.
+_VERIFY_CACHE: dict[tuple[bytes, str], bool] = {}
+_VERIFY_CACHE_MAX = 1024
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
@@ -21,29 +45,60 @@ def create_access_token(subject: str | Any, expires_delta: timedelta | None = No
     Returns:
         Encoded JWT token
     """
+    # JWT exp is a NumericDate (epoch seconds) - straight arithmetic,
+    # no datetime objects needed
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        exp = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        exp = int(time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+    to_encode = {"exp": exp, "sub": str(subject)}
+
+    if not _IS_HS256:
+        return jwt.encode(
+            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
         )
-    
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+
+    payload_b64 = base64.urlsafe_b64encode(
+        json.dumps(to_encode, separators=(",", ":")).encode()
+    ).rstrip(b"=")
+    signing_input = _HEADER_B64 + b"." + payload_b64
+    signature_b64 = base64.urlsafe_b64encode(
+        hmac.new(_KEY, signing_input, hashlib.sha256).digest()
+    ).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash.
-    
+
+    With settings.CACHE_PASSWORD_VERIFY enabled, repeated verifications
+    of the same pair skip the ~100ms bcrypt computation after the first
+    call. This is opt-in: the cache makes repeat timing observable, so
+    it is only appropriate for internal service credentials.
+
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password
-        
+
     Returns:
         True if password matches
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if not settings.CACHE_PASSWORD_VERIFY:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("ascii")
+        )
+
+    key = (hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+    result = _VERIFY_CACHE.get(key)
+    if result is None:
+        result = bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("ascii")
+        )
+        if len(_VERIFY_CACHE) >= _VERIFY_CACHE_MAX:
+            _VERIFY_CACHE.pop(next(iter(_VERIFY_CACHE)))
+        _VERIFY_CACHE[key] = result
+    return result
 
 
 def get_password_hash(password: str) -> str:
@@ -55,4 +110,6 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(_BCRYPT_ROUNDS)
+    ).decode("ascii")
@@ -1,16 +1,41 @@
 """Database session management."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import get_settings
+
+settings = get_settings()
+
+_url = str(settings.DATABASE_URL)
 
-from app.config import settings
+# echo compiles and logs every statement - debug only. Pool tuning
+# applies to the Postgres QueuePool; SQLite's pool takes no size args.
+# LIFO checkout keeps recently used connections hot, and recycling
+# plus pre-ping avoids handing out connections the server has dropped.
+_engine_kwargs: dict[str, Any] = {
+    "echo": settings.DEBUG,
+    "future": True,
+    "pool_pre_ping": True,
+}
+if not _url.startswith("sqlite"):
+    _engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
 
-engine = create_async_engine(str(settings.DATABASE_URL), echo=True, future=True)
+engine = create_async_engine(_url, **_engine_kwargs)
 
-AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False, autocommit=False, autoflush=False
+AsyncSessionLocal = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False
 )
 
 
@@ -20,8 +45,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         Database session
     """
+    # async with already closes the session on exit; no explicit
+    # close() needed
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
@@ -4,12 +4,15 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
+from app.api.v1 import insights
+from app.config import get_settings
 from app.core.exceptions import AppException
 from app.utils.logger import setup_logging
 
+settings = get_settings()
+
 # Set up logging
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -18,9 +21,11 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson serializes responses several times faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
-logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
+logger.info("Starting %s v%s", settings.PROJECT_NAME, settings.VERSION)
 
 # CORS middleware
 app.add_middleware(
@@ -33,22 +38,31 @@ app.add_middleware(
 
 
 @app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """Handle custom application exceptions.
-    
+
     Args:
         request: The incoming request
         exc: The application exception
-        
+
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "error_code": exc.error_code},
     )
 
 
+@app.on_event("shutdown")
+async def shutdown_groq_client() -> None:
+    """Close the shared Groq HTTP connection pool on shutdown."""
+    from app.core.ai_engine import groq_client
+
+    if groq_client._groq_singleton is not None:
+        await groq_client._groq_singleton.aclose()
+
+
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint.
@@ -60,6 +74,4 @@ async def health_check() -> dict[str, str]:
 
 
 # Include API routers
-from app.api.v1 import insights
-
 app.include_router(insights.router, prefix=settings.API_V1_STR, tags=["insights"])
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class InsightSeverity(str, Enum):
@@ -74,13 +74,22 @@ class InsightListResponse(BaseModel):
     total: int
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
-    pages: int
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def pages(self) -> int:
+        """Total page count, derived from total and page_size."""
+        if self.total == 0:
+            return 1
+        return (self.total + self.page_size - 1) // self.page_size
+
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def has_next(self) -> bool:
         """Check if there are more pages."""
         return self.page < self.pages
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def has_prev(self) -> bool:
         """Check if there are previous pages."""
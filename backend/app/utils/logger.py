@@ -1,28 +1,42 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from app.config import settings
-
 
 def setup_logging() -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+
+    The real console and file handlers live behind a QueueListener on a
+    background thread, so a log call on the request path is just an
+    in-memory queue.put instead of a blocking write() under the GIL.
+    """
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        # Console handler
+        logging.StreamHandler(sys.stdout),
+        # File handler
+        logging.FileHandler(log_dir / "app.log"),
+        respect_handler_level=True,
+    )
+    listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(listener.stop)
+
     # Configure root logger
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            # Console handler
-            logging.StreamHandler(sys.stdout),
-            # File handler
-            logging.FileHandler(log_dir / "app.log"),
-        ],
+        handlers=[QueueHandler(log_queue)],
     )
 
     # Set specific log levels for different modules